@@ -19,8 +19,9 @@ from config import (
     get_mongo_client,
     log_conversation,
     create_or_update_user_session,
-    get_gemini_response,
+    get_tutor_response,
 )
+from prompts import BLOOMS_BY_ID
 
 # Load environment variables
 load_dotenv()
@@ -350,11 +351,10 @@ def render_sidebar(config: dict, gemini_ready: bool, mongo_ready: bool):
                     str(level), {}
                 )
                 level_name = level_info.get("name", f"Level {level}")
-                blooms_levels = config.get("blooms_levels", [])
-                level_data = next((l for l in blooms_levels if l["id"] == level), None)
+                level_data = BLOOMS_BY_ID.get(level)
                 if level_data:
                     st.markdown(
-                        f"<span class='blooms-badge blooms-{level}'>{level_data['icon']} {level_name}</span>",
+                        f"<span class='blooms-badge blooms-{level}'>{level_data.icon} {level_name}</span>",
                         unsafe_allow_html=True,
                     )
 
@@ -524,7 +524,7 @@ def render_level_selection(config: dict):
             level_idx = row * 3 + col_idx
             if level_idx < len(blooms_levels):
                 level = blooms_levels[level_idx]
-                level_id = level["id"]
+                level_id = level.id
 
                 with cols[col_idx]:
                     # Check if this level exists in the cohort
@@ -534,9 +534,9 @@ def render_level_selection(config: dict):
                         st.markdown(
                             f"""
                         <div class="level-card">
-                            <div style="font-size: 1.5rem; margin-bottom: 0.3rem;">{level["icon"]}</div>
-                            <div style="font-weight: 600; color: #1a1a1a;">Level {level_id}: {level["name"]}</div>
-                            <div style="font-size: 0.8rem; color: #666;">{level["description"]}</div>
+                            <div style="font-size: 1.5rem; margin-bottom: 0.3rem;">{level.icon}</div>
+                            <div style="font-weight: 600; color: #1a1a1a;">Level {level_id}: {level.name}</div>
+                            <div style="font-size: 0.8rem; color: #666;">{level.description}</div>
                         </div>
                         """,
                             unsafe_allow_html=True,
@@ -554,8 +554,8 @@ def render_level_selection(config: dict):
                         st.markdown(
                             f"""
                         <div class="level-card" style="opacity: 0.5;">
-                            <div style="font-size: 1.5rem; margin-bottom: 0.3rem;">{level["icon"]}</div>
-                            <div style="font-weight: 600; color: #999;">Level {level_id}: {level["name"]}</div>
+                            <div style="font-size: 1.5rem; margin-bottom: 0.3rem;">{level.icon}</div>
+                            <div style="font-weight: 600; color: #999;">Level {level_id}: {level.name}</div>
                             <div style="font-size: 0.8rem; color: #999;">Not available</div>
                         </div>
                         """,
@@ -583,9 +583,8 @@ def render_chat_interface(config: dict, mongo_client, gemini_ready: bool):
     cohort_icons = {"hybrid": "🤝", "ai": "🤖"}
     cohort_icon = cohort_icons.get(cohort["type"], "🤖")
 
-    blooms_levels = config.get("blooms_levels", [])
-    blooms_data = next((l for l in blooms_levels if l["id"] == level), None)
-    level_icon = blooms_data["icon"] if blooms_data else "📝"
+    blooms_data = BLOOMS_BY_ID.get(level)
+    level_icon = blooms_data.icon if blooms_data else "📝"
 
     st.markdown(
         f'<p class="main-header">{course["icon"]} {course["name"]} — {cohort_icon} {cohort["name"]} — {level_icon} {level_name}</p>',
@@ -636,6 +635,11 @@ def render_chat_interface(config: dict, mongo_client, gemini_ready: bool):
         )
         return
 
+    # Without a system prompt the model has no tutoring instructions at all
+    if not system_prompt.strip():
+        st.warning("⚠️ This level's tutor is not configured yet.")
+        return
+
     if prompt := st.chat_input("Type your message..."):
         chat_history.append({"role": "user", "content": prompt})
 
@@ -644,10 +648,12 @@ def render_chat_interface(config: dict, mongo_client, gemini_ready: bool):
 
         with st.chat_message("assistant"):
             with st.spinner(""):
-                response = get_gemini_response(
+                response = get_tutor_response(
+                    level=level,
                     system_prompt=system_prompt,
                     chat_history=chat_history[:-1],
                     user_message=prompt,
+                    problems=level_data.get("problems"),
                 )
                 st.markdown(response)
 
@@ -1,6 +1,11 @@
+import atexit
 import json
 import os
+import re
+import threading
+import time
 from datetime import datetime
+from functools import lru_cache
 
 import streamlit as st
 import google.generativeai as genai
@@ -8,11 +13,62 @@ from pymongo import MongoClient
 
 # Import prompts from Python module
 from prompts import get_config as get_prompts_config
+from prompts import get_prompt_hash
 
 
 # --- Local Storage Paths ---
 LOCAL_LOGS_FILE = os.path.join(os.path.dirname(__file__), "local_logs.json")
 
+# --- Tutor Response Cache ---
+# How long (seconds) a cached opening answer stays valid for each Bloom's level.
+# Levels without an entry are never cached.
+RESPONSE_CACHE_TTL_BY_LEVEL = {
+    1: 30 * 24 * 3600,
+    2: 30 * 24 * 3600,
+    3: 30 * 24 * 3600,
+    4: 7 * 24 * 3600,
+    5: 3600,
+}
+# Kill-switch for levels whose answers depend on the student's own work.
+RESPONSE_CACHE_ALLOWED_BY_LEVEL = {5: False}
+RESPONSE_CACHE_MAX_ENTRIES = 1024
+# How long (seconds) a session waits for another one generating the same
+# answer before asking Gemini itself.
+RESPONSE_PENDING_TIMEOUT = 30
+
+# Shared by every Streamlit session thread; guarded by _response_cache_lock.
+# _response_pending holds an Event per key being generated, so concurrent
+# misses for the same question wait for one Gemini call instead of each
+# making their own.
+_response_cache: dict = {}
+_response_pending: dict = {}
+_response_cache_lock = threading.Lock()
+_CACHE_KEY_APOSTROPHE_RE = re.compile(r"['\u2019]")
+_CACHE_KEY_TOKEN_RE = re.compile(
+    r"[-+\u2212]?\$?\d(?:[\d,.]*\d)?%?|\w+|!=|[<>=\u2260\u2264\u2265]+"
+)
+
+# --- Numeric Answer Checking ---
+_ANSWER_NUMBER_RE = re.compile(
+    r"(?<![\w.])([-+\u2212]?)\s*\$?\s*([-\u2212]?)(\d[\d,]*(?:\.\d+)?)"
+    r"(?!\s*%)\s*(million|mn|m|k)?\b",
+    re.IGNORECASE,
+)
+_ANSWER_CUE_RE = re.compile(
+    r"=|\b(?:net|answer|got|get|result|equals?|comes? to|is it)\b", re.IGNORECASE
+)
+_ANSWER_WORD_RE = re.compile(r"[a-z]+", re.IGNORECASE)
+# Words that show the student has moved on to judging the project
+_VERDICT_WORD_RE = re.compile(
+    r"\b(?:accept\w*|reject\w*|(?:in)?efficient|worth)\b", re.IGNORECASE
+)
+_AMOUNT_MULTIPLIERS = {
+    "million": 1_000_000,
+    "mn": 1_000_000,
+    "m": 1_000_000,
+    "k": 1_000,
+}
+
 
 def load_config() -> dict:
     """
@@ -49,27 +105,209 @@ def init_gemini() -> bool:
         return False
 
 
+@lru_cache(maxsize=64)
+def get_gemini_model(system_prompt: str) -> genai.GenerativeModel:
+    """
+    Get the Gemini model for a system prompt.
+
+    Every student in a cohort level sends the same system prompt, so one
+    model instance per prompt is shared across sessions and reruns.
+    """
+    return genai.GenerativeModel(
+        model_name="gemini-2.0-flash", system_instruction=system_prompt
+    )
+
+
+def _generate_gemini_response(
+    system_prompt: str, chat_history: list, user_message: str
+) -> str:
+    """Send a chat turn to Gemini and return the response text."""
+    model = get_gemini_model(system_prompt)
+
+    history = []
+    for msg in chat_history:
+        role = "user" if msg["role"] == "user" else "model"
+        history.append({"role": role, "parts": [msg["content"]]})
+
+    chat = model.start_chat(history=history)
+    response = chat.send_message(user_message)
+
+    return response.text
+
+
 def get_gemini_response(
     system_prompt: str, chat_history: list, user_message: str
 ) -> str:
     """Get response from Gemini API."""
     try:
-        model = genai.GenerativeModel(
-            model_name="gemini-2.0-flash", system_instruction=system_prompt
+        return _generate_gemini_response(system_prompt, chat_history, user_message)
+    except Exception as e:
+        return f"I apologize, but I encountered an error: {str(e)}"
+
+
+def _format_amount(amount: int) -> str:
+    """Format a dollar amount the way the problem set writes it ($600k, $4M)."""
+    amount = abs(amount)
+    if amount >= 1_000_000:
+        return f"${amount / 1_000_000:g}M"
+    if amount >= 1_000:
+        return f"${amount / 1_000:g}k"
+    return f"${amount:,}"
+
+
+def _problem_keywords(problem: dict) -> set:
+    """Lower-cased words that identify a problem, e.g. {"wetland", "highway"}."""
+    return {word.lower() for word in problem["name"].split() if len(word) > 3}
+
+
+def _current_problem(problems: list, chat_history: list) -> tuple:
+    """
+    Find the problem the chat is about: the last one named in the history.
+
+    Returns (problem, messages since it was last named), or (None, []) when
+    no problem has come up yet.
+    """
+    for index in range(len(chat_history) - 1, -1, -1):
+        words = set(_ANSWER_WORD_RE.findall(chat_history[index]["content"].lower()))
+        for problem in problems:
+            if _problem_keywords(problem) & words:
+                return problem, chat_history[index:]
+    return None, []
+
+
+def check_numeric_answer(
+    problems: list, user_message: str, chat_history: list = None
+) -> str | None:
+    """
+    Check a student's net-benefit answer without calling the LLM.
+
+    Returns a reply when the message is just an amount, or an amount with an
+    answer cue ("I got -100k"), for the problem under discussion and that
+    amount is either correct or has the wrong sign. Questions, messages that
+    already give a verdict, and problems whose verdict the student has
+    already given are left to the LLM (None).
+    """
+    if "?" in user_message or _VERDICT_WORD_RE.search(user_message):
+        return None
+
+    matches = _ANSWER_NUMBER_RE.findall(user_message)
+    if len(matches) != 1:
+        return None
+
+    sign, inner_sign, digits, unit = matches[0]
+    remainder = _ANSWER_NUMBER_RE.sub(" ", user_message)
+    if _ANSWER_WORD_RE.search(remainder) and not _ANSWER_CUE_RE.search(remainder):
+        return None
+
+    value = float(digits.replace(",", ""))
+    value *= _AMOUNT_MULTIPLIERS.get(unit.lower(), 1)
+    if (sign or inner_sign) in ("-", "\u2212"):
+        value = -value
+
+    problem, since_named = _current_problem(problems, chat_history or [])
+    if problem is not None:
+        verdict_given = any(
+            msg["role"] == "user" and _VERDICT_WORD_RE.search(msg["content"])
+            for msg in since_named
         )
+        if verdict_given:
+            return None
+        problems = [problem]
+
+    for problem in problems:
+        expected = problem["expected_net"]
+        benefit = _format_amount(problem["benefit"])
+        cost = _format_amount(problem["cost"])
+
+        if value == expected:
+            direction = "negative" if expected < 0 else "positive"
+            return (
+                f"Correct. Since the Net Benefit is {direction}, "
+                "is the project efficient?"
+            )
+        if value == -expected:
+            comparison = "higher" if problem["cost"] > problem["benefit"] else "lower"
+            return (
+                f"Check your subtraction for the {problem['name']}. "
+                f"Costs ({cost}) are {comparison} than benefits ({benefit})."
+            )
+
+    return None
+
+
+def _response_cache_key(system_prompt: str, user_message: str) -> tuple:
+    """
+    Build the cache key for an opening question under a system prompt.
 
-        history = []
-        for msg in chat_history:
-            role = "user" if msg["role"] == "user" else "model"
-            history.append({"role": role, "parts": [msg["content"]]})
+    Case, apostrophes and punctuation are ignored, so "What's NPV?" and
+    "whats npv" share an entry. Numbers keep their sign, currency and
+    percent marks, and comparison operators are kept, so "NPV > 0?" and
+    "NPV < 0?" stay apart.
+    """
+    message = _CACHE_KEY_APOSTROPHE_RE.sub("", user_message.casefold())
+    tokens = _CACHE_KEY_TOKEN_RE.findall(message)
+    return get_prompt_hash(system_prompt), " ".join(tokens)
 
-        chat = model.start_chat(history=history)
-        response = chat.send_message(user_message)
 
-        return response.text
+def get_tutor_response(
+    level: int,
+    system_prompt: str,
+    chat_history: list,
+    user_message: str,
+    problems: list = None,
+) -> str:
+    """
+    Get a tutor response, reusing cached answers where the level allows it.
 
+    Numeric answers to the level's known problems are checked directly.
+    Only the opening turn of a chat is cached, since later answers depend on
+    the conversation so far. Numbers are kept in the key so different
+    calculations never share an answer.
+    """
+    if problems:
+        reply = check_numeric_answer(problems, user_message, chat_history)
+        if reply:
+            return reply
+
+    ttl = RESPONSE_CACHE_TTL_BY_LEVEL.get(level)
+    allowed = RESPONSE_CACHE_ALLOWED_BY_LEVEL.get(level, True)
+    if chat_history or not ttl or not allowed:
+        return get_gemini_response(system_prompt, chat_history, user_message)
+
+    key = _response_cache_key(system_prompt, user_message)
+
+    while True:
+        with _response_cache_lock:
+            cached = _response_cache.get(key)
+            if cached is not None:
+                created_at, response = cached
+                if time.time() - created_at < ttl:
+                    return response
+                _response_cache.pop(key, None)
+
+            pending = _response_pending.get(key)
+            if pending is None:
+                pending = _response_pending[key] = threading.Event()
+                break
+        # Another session is generating this answer; use theirs
+        if not pending.wait(RESPONSE_PENDING_TIMEOUT):
+            return get_gemini_response(system_prompt, chat_history, user_message)
+
+    # Release waiters however this ends, including Streamlit's stop/rerun
+    # exceptions, which are not Exceptions
+    try:
+        response = _generate_gemini_response(system_prompt, chat_history, user_message)
+        with _response_cache_lock:
+            if len(_response_cache) >= RESPONSE_CACHE_MAX_ENTRIES:
+                _response_cache.pop(next(iter(_response_cache)), None)
+            _response_cache[key] = (time.time(), response)
     except Exception as e:
         return f"I apologize, but I encountered an error: {str(e)}"
+    finally:
+        with _response_cache_lock:
+            _response_pending.pop(key).set()
+
+    return response
 
 
 # -----------------------------------------------------------------------------
@@ -77,24 +315,46 @@ def get_gemini_response(
 # -----------------------------------------------------------------------------
 
 
+_mongo_client = None
+_mongo_client_lock = threading.Lock()
+
+
 def get_mongo_client():
-    """Get MongoDB client connection."""
+    """
+    Get the shared MongoDB client connection.
+
+    MongoClient is thread-safe and pools its own sockets, so one client is
+    created (and pinged) per process and reused across Streamlit reruns.
+    A failed connection is not remembered, so the next call tries again.
+    """
+    global _mongo_client
+    if _mongo_client is not None:
+        return _mongo_client
+
     mongo_uri = os.getenv("MONGO_URI")
     if not mongo_uri or mongo_uri == "your_mongodb_uri_here":
         return None
 
-    try:
-        client = MongoClient(
-            mongo_uri,
-            serverSelectionTimeoutMS=5000,
-            tls=True,
-            tlsAllowInvalidCertificates=True,
-        )
-        client.admin.command("ping")
-        return client
-    except Exception:
-        # Silently fail - we'll use local storage as fallback
-        return None
+    with _mongo_client_lock:
+        if _mongo_client is None:
+            client = None
+            try:
+                client = MongoClient(
+                    mongo_uri,
+                    serverSelectionTimeoutMS=5000,
+                    tls=True,
+                    tlsAllowInvalidCertificates=True,
+                )
+                client.admin.command("ping")
+            except Exception:
+                # Silently fail - we'll use local storage as fallback
+                if client is not None:
+                    client.close()
+                return None
+            _mongo_client = client
+            atexit.register(client.close)
+
+    return _mongo_client
 
 
 # -----------------------------------------------------------------------------
@@ -10,7 +10,7 @@ import uuid
 import random
 import string
 from datetime import datetime
-from pymongo import MongoClient
+from pymongo import ASCENDING, DESCENDING, MongoClient
 from pymongo.errors import CollectionInvalid, OperationFailure
 
 # Load environment variables
@@ -165,6 +165,11 @@ def setup_users_collection_with_validation(db):
     db.users.create_index("email")
     print("✅ Created index on 'email' field")
 
+    # Create indexes for "recent users" queries, optionally filtered by source
+    db.users.create_index([("created_at", DESCENDING)])
+    db.users.create_index([("source", ASCENDING), ("created_at", DESCENDING)])
+    print("✅ Created indexes on 'created_at' and 'source, created_at' fields")
+
 
 def read_csv_users(csv_path: str, auto_generate_credentials: bool = True) -> tuple:
     """
@@ -3,13 +3,29 @@ Email Sender Script for ERG AI Tool
 Sends emails to users from the database or CSV using Gmail SMTP.
 """
 
+import argparse
+import atexit
+import csv
+import itertools
+import json
 import os
+import queue
+import random
+import re
 import smtplib
 import ssl
+import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from datetime import datetime
-from pymongo import MongoClient
+from email.policy import compat32
+from datetime import datetime, timedelta
+from functools import lru_cache
+from pymongo import ASCENDING, DESCENDING, MongoClient
+from pymongo.errors import OperationFailure
 
 from dotenv import load_dotenv
 
@@ -20,14 +36,42 @@ load_dotenv()
 # Configuration
 # =============================================================================
 
-# Gmail SMTP settings
+# Gmail SMTP settings. Port 465 connects over TLS directly, saving the
+# STARTTLS round trip; set SMTP_PORT=587 where only STARTTLS gets through.
 SMTP_SERVER = "smtp.gmail.com"
-SMTP_PORT = 587
+SMTP_SSL_PORT = 465
+SMTP_PORT = int(os.getenv("SMTP_PORT", SMTP_SSL_PORT))
+
+# Gmail accepts about 100 messages per connection; reconnect after that many
+SMTP_MAX_MSGS_PER_CONNECTION = 100
+
+# Messages per second across all pooled connections (0 for no limit), so a
+# bulk send doesn't trip Gmail's rate limiting part way through
+SMTP_RATE_PER_SEC = 10
+
+# Parallel SMTP connections for bulk sends (--concurrency); Gmail allows
+# up to SMTP_MAX_CONCURRENCY simultaneous connections per account
+SMTP_CONCURRENCY = 5
+SMTP_MAX_CONCURRENCY = 15
+
+# Reply codes for temporary server trouble (busy, mailbox unavailable,
+# local error, out of storage, TLS not available); these sends are retried
+# after a backoff
+SMTP_TRANSIENT_CODES = (421, 450, 451, 452, 454)
+SMTP_SEND_ATTEMPTS = 3
+
+# One TLS context for every connection; building it loads the CA bundle
+_SSL_CONTEXT = ssl.create_default_context()
 
 # Email credentials from environment
 SENDER_EMAIL = os.getenv("GMAIL_SENDER_EMAIL")
 GMAIL_APP_PASSWORD = os.getenv("GMAIL_APP_PASSWORD")
 
+MONGO_URI = os.getenv("MONGO_URI")
+
+# How often a scheduled send re-checks the clock while waiting
+SCHEDULE_POLL_SECONDS = 60
+
 
 # =============================================================================
 # Email Templates
@@ -102,6 +146,19 @@ def get_reminder_email_body(
     """
     Generate a reminder email body for users to complete their cohort.
     """
+    return f"""
+Dear {user_name},
+{_reminder_email_text(cohort_number, whatsapp_link)}"""
+
+
+@lru_cache(maxsize=16)
+def _reminder_email_text(cohort_number: int, whatsapp_link: str = None) -> str:
+    """
+    Everything after the greeting of the reminder email.
+
+    It only depends on the cohort and WhatsApp link, so it is built once per
+    reminder run instead of once per recipient.
+    """
     whatsapp_section = ""
     if whatsapp_link:
         whatsapp_section = f"""
@@ -113,8 +170,6 @@ WhatsApp Group: {whatsapp_link}
 """
 
     return f"""
-Dear {user_name},
-
 This is a friendly reminder to complete Cohort-{cohort_number} of the ERG study.
 
 IMPORTANT
@@ -143,24 +198,98 @@ Yash Nagaraj
 # =============================================================================
 
 
+_mongo_client = None
+_mongo_client_lock = threading.Lock()
+
+# The script makes few concurrent queries; keep a couple of sockets warm
+# between them instead of opening up to PyMongo's default of 100
+MONGO_MAX_POOL_SIZE = 10
+MONGO_MIN_POOL_SIZE = 2
+
+
 def get_mongo_client():
-    """Get MongoDB client connection."""
-    mongo_uri = os.getenv("MONGO_URI")
-    if not mongo_uri:
+    """
+    Get the shared MongoDB client connection.
+
+    The client is created and pinged on the first call and reused afterwards;
+    MongoClient pools its own sockets. It is closed when the script exits.
+    """
+    global _mongo_client
+    if _mongo_client is not None:
+        return _mongo_client
+
+    if not MONGO_URI:
         raise ValueError("MONGO_URI environment variable is not set")
 
+    with _mongo_client_lock:
+        if _mongo_client is None:
+            client = None
+            try:
+                client = MongoClient(
+                    MONGO_URI,
+                    serverSelectionTimeoutMS=5000,
+                    tls=True,
+                    tlsAllowInvalidCertificates=True,
+                    maxPoolSize=MONGO_MAX_POOL_SIZE,
+                    minPoolSize=MONGO_MIN_POOL_SIZE,
+                )
+                client.admin.command("ping")
+            except Exception as e:
+                if client is not None:
+                    client.close()
+                raise ConnectionError(f"Failed to connect to MongoDB: {e}")
+            print("✅ Successfully connected to MongoDB")
+            _mongo_client = client
+            atexit.register(client.close)
+
+    return _mongo_client
+
+
+# Databases whose users indexes were already checked by this process
+_indexed_dbs = set()
+
+
+def ensure_user_indexes(db):
+    """
+    Create the indexes behind the user queries below, once per process.
+
+    created_at turns get_new_users_from_db into a range scan; source +
+    created_at covers filters such as {"source": "csv_import"}; username
+    and email serve the single-user lookups. create_index is a no-op when
+    the index already exists.
+    """
+    if db.name in _indexed_dbs:
+        return
+    collection = db["users"]
+    collection.create_index([("created_at", DESCENDING)])
+    collection.create_index([("source", ASCENDING), ("created_at", DESCENDING)])
+    collection.create_index("email")
     try:
-        client = MongoClient(
-            mongo_uri,
-            serverSelectionTimeoutMS=5000,
-            tls=True,
-            tlsAllowInvalidCertificates=True,
-        )
-        client.admin.command("ping")
-        print("✅ Successfully connected to MongoDB")
-        return client
-    except Exception as e:
-        raise ConnectionError(f"Failed to connect to MongoDB: {e}")
+        # Same unique index as ingest_users.py creates
+        collection.create_index("username", unique=True)
+    except OperationFailure as e:
+        print(f"⚠️ Could not create unique index on 'username': {e}")
+    _indexed_dbs.add(db.name)
+
+
+# Only the fields the senders read; also keeps the hashed password out
+_USER_PROJECTION = {"_id": 0, "email": 1, "name": 1, "username": 1}
+
+# Users fetched per round trip when streaming from a cursor
+USERS_BATCH_SIZE = 100
+
+
+def get_users_cursor(db, filter_query: dict = None):
+    """
+    Get a cursor over users in the database, fetched 100 at a time.
+
+    Unlike get_users_from_db, nothing is read until the cursor is iterated
+    and the users are never all held in memory; use it where the count is
+    not needed up front.
+    """
+    ensure_user_indexes(db)
+    query = filter_query or {}
+    return db["users"].find(query, _USER_PROJECTION).batch_size(USERS_BATCH_SIZE)
 
 
 def get_users_from_db(db, filter_query: dict = None) -> list:
@@ -174,25 +303,68 @@ def get_users_from_db(db, filter_query: dict = None) -> list:
     Returns:
         List of user documents
     """
-    collection = db["users"]
-    query = filter_query or {}
-    users = list(collection.find(query, {"password": 0}))  # Exclude hashed password
+    users = list(get_users_cursor(db, filter_query))
     print(f"📄 Found {len(users)} users in database")
     return users
 
 
-def get_new_users_from_db(db, since_hours: int = 24) -> list:
+def count_users(db, filter_query: dict = None) -> int:
+    """Count the users get_users_cursor would return, without reading them."""
+    ensure_user_indexes(db)
+    return db["users"].count_documents(filter_query or {})
+
+
+def get_users_by_emails(db, emails: list) -> dict:
     """
-    Get users added in the last N hours.
+    Look up several users by email address in one query.
+
+    Returns a dict mapping each address found to its user document;
+    addresses without a user are left out.
     """
-    from datetime import timedelta
+    ensure_user_indexes(db)
+    cursor = db["users"].find({"email": {"$in": list(emails)}}, _USER_PROJECTION)
+    return {user["email"]: user for user in cursor}
 
-    collection = db["users"]
+
+def _new_users_match(since_hours: int) -> dict:
+    """Query for users with an email address added in the last N hours."""
     cutoff_time = datetime.utcnow() - timedelta(hours=since_hours)
+    return {"created_at": {"$gte": cutoff_time}, "email": {"$nin": ["", None]}}
 
-    users = list(
-        collection.find({"created_at": {"$gte": cutoff_time}}, {"password": 0})
-    )
+
+def get_new_users_cursor(db, since_hours: int = 24):
+    """
+    Get a cursor over users added in the last N hours, fetched 100 at a time.
+
+    The server leaves out users without an email address and fills in
+    "User" for a missing name, so those never cross the network.
+    """
+    ensure_user_indexes(db)
+    pipeline = [
+        {"$match": _new_users_match(since_hours)},
+        {
+            "$project": {
+                "_id": 0,
+                "email": 1,
+                "username": 1,
+                "name": {"$ifNull": ["$name", "User"]},
+            }
+        },
+    ]
+    return db["users"].aggregate(pipeline, batchSize=USERS_BATCH_SIZE)
+
+
+def count_new_users(db, since_hours: int = 24) -> int:
+    """Count the users get_new_users_cursor would return."""
+    ensure_user_indexes(db)
+    return db["users"].count_documents(_new_users_match(since_hours))
+
+
+def get_new_users_from_db(db, since_hours: int = 24) -> list:
+    """
+    Get users added in the last N hours.
+    """
+    users = list(get_new_users_cursor(db, since_hours))
     print(f"📄 Found {len(users)} users added in the last {since_hours} hours")
     return users
 
@@ -202,12 +374,229 @@ def get_new_users_from_db(db, since_hours: int = 24) -> list:
 # =============================================================================
 
 
+_MISSING_CREDENTIALS_ERROR = (
+    "GMAIL_SENDER_EMAIL or GMAIL_APP_PASSWORD not set in environment"
+)
+
+
+def _require_smtp_env():
+    """Raise ValueError unless the Gmail credentials are configured."""
+    if not SENDER_EMAIL or not GMAIL_APP_PASSWORD:
+        raise ValueError(_MISSING_CREDENTIALS_ERROR)
+
+
+# Line endings smtplib normalizes to CRLF before sending a str message
+_EOL_RE = re.compile(r"(?:\r\n|\n|\r(?!\n))")
+
+# Serializes messages straight to SMTP wire format (CRLF, unfolded headers
+# like as_string()), so no per-send str-to-bytes pass is needed
+_WIRE_POLICY = compat32.clone(linesep="\r\n", max_line_length=None)
+
+
+class PipelinedSMTP(smtplib.SMTP):
+    """
+    smtplib.SMTP that pipelines each message's envelope (RFC 2920).
+
+    When the server advertises PIPELINING (Gmail does), MAIL FROM, every
+    RCPT TO and DATA are written back to back and their replies read
+    afterwards. A message then costs two round trips instead of one per
+    command. Otherwise, or when ESMTP options are passed, it falls back to
+    smtplib's sendmail. Return value and exceptions match sendmail.
+    """
+
+    def sendmail(self, from_addr, to_addrs, msg, mail_options=(), rcpt_options=()):
+        self.ehlo_or_helo_if_needed()
+        if not self.has_extn("pipelining") or mail_options or rcpt_options:
+            return super().sendmail(
+                from_addr, to_addrs, msg, mail_options, rcpt_options
+            )
+
+        if isinstance(msg, str):
+            msg = _EOL_RE.sub("\r\n", msg).encode("ascii")
+        if isinstance(to_addrs, str):
+            to_addrs = [to_addrs]
+
+        size = f" size={len(msg)}" if self.has_extn("size") else ""
+        self.putcmd("mail", f"FROM:{smtplib.quoteaddr(from_addr)}{size}")
+        for addr in to_addrs:
+            self.putcmd("rcpt", f"TO:{smtplib.quoteaddr(addr)}")
+        self.putcmd("data")
+
+        mail_code, mail_resp = self.getreply()
+        refused = {}
+        for addr in to_addrs:
+            code, resp = self.getreply()
+            if code not in (250, 251):
+                refused[addr] = (code, resp)
+        data_code, data_resp = self.getreply()
+
+        envelope_failed = mail_code != 250 or len(refused) == len(to_addrs)
+        if envelope_failed and data_code == 354:
+            # Nobody would receive the message; end the transaction empty
+            self.send(b".\r\n")
+            self.getreply()
+
+        if mail_code != 250:
+            self._abort_transaction(mail_code)
+            raise smtplib.SMTPSenderRefused(mail_code, mail_resp, from_addr)
+        if len(refused) == len(to_addrs):
+            self._abort_transaction(max(code for code, _ in refused.values()))
+            raise smtplib.SMTPRecipientsRefused(refused)
+        if data_code != 354:
+            self._abort_transaction(data_code)
+            raise smtplib.SMTPDataError(data_code, data_resp)
+
+        data = re.sub(rb"(?m)^\.", b"..", msg)
+        if not data.endswith(b"\r\n"):
+            data += b"\r\n"
+        self.send(data + b".\r\n")
+
+        code, resp = self.getreply()
+        if code != 250:
+            self._abort_transaction(code)
+            raise smtplib.SMTPDataError(code, resp)
+        return refused
+
+    def _abort_transaction(self, code: int):
+        # 421 means the server is closing the connection
+        if code == 421:
+            self.close()
+        else:
+            self._rset()
+
+
+class PipelinedSMTP_SSL(PipelinedSMTP, smtplib.SMTP_SSL):
+    """PipelinedSMTP over a connection that is TLS from the start."""
+
+
+def _open_smtp_connection() -> smtplib.SMTP:
+    """Open a TLS connection to Gmail and log in."""
+    implicit_tls = SMTP_PORT == SMTP_SSL_PORT
+    if implicit_tls:
+        server = PipelinedSMTP_SSL(SMTP_SERVER, SMTP_PORT, context=_SSL_CONTEXT)
+    else:
+        server = PipelinedSMTP(SMTP_SERVER, SMTP_PORT)
+    try:
+        if not implicit_tls:
+            server.starttls(context=_SSL_CONTEXT)
+        server.login(SENDER_EMAIL, GMAIL_APP_PASSWORD)
+    except Exception:
+        server.close()
+        raise
+    return server
+
+
+def _build_message(subject: str, body: str, is_html: bool = False) -> MIMEMultipart:
+    """Build the MIME message, without a To header."""
+    message = MIMEMultipart("alternative")
+    message["Subject"] = subject
+    message["From"] = SENDER_EMAIL
+
+    # Attach body
+    if is_html:
+        part = MIMEText(body, "html")
+    else:
+        part = MIMEText(body, "plain")
+    message.attach(part)
+
+    return message
+
+
+@lru_cache(maxsize=8)
+def _message_template(subject: str, is_html: bool = False) -> tuple:
+    """
+    Serialize the multipart envelope for a subject once.
+
+    Returns (head, tail, boundary) as bytes: the headers up to the opening
+    boundary line and the closing boundary. A rendered body part spliced
+    between them gives the same bytes as flattening a freshly built message.
+    """
+    envelope = _build_message(subject, "", is_html)
+    flattened = envelope.as_bytes(policy=_WIRE_POLICY)
+    boundary = envelope.get_boundary().encode("ascii")
+    opening = b"--" + boundary + b"\r\n"
+    head = flattened[: flattened.index(opening) + len(opening)]
+    return head, b"\r\n--" + boundary + b"--\r\n", boundary
+
+
+@lru_cache(maxsize=32)
+def _flatten_message(subject: str, body: str, is_html: bool = False) -> bytes:
+    """
+    Serialize a message, without its To header, to the bytes sent over SMTP.
+
+    Bulk sends often repeat the same subject and body, so the flattened text
+    is cached and only the To line is added per recipient. Personalized
+    bodies reuse the subject's envelope and only render their own text part.
+    """
+    head, tail, boundary = _message_template(subject, is_html)
+    part = MIMEText(body, "html" if is_html else "plain")
+    part = part.as_bytes(policy=_WIRE_POLICY)
+    if boundary in part:
+        # The shared boundary must not appear in the body; let the email
+        # package pick a fresh one
+        message = _build_message(subject, body, is_html)
+        return message.as_bytes(policy=_WIRE_POLICY)
+    return head + part + tail
+
+
+def _send_on_connection(
+    server: smtplib.SMTP, to_email, subject: str, body: str, is_html=False
+) -> dict:
+    """
+    Send one email over an already authenticated connection.
+
+    to_email may be a list to deliver the same message to several recipients
+    in one SMTP transaction. They are then left out of the To header so they
+    don't see each other's addresses. Returns smtplib's refused-recipients dict.
+    """
+    if isinstance(to_email, str):
+        to_header = to_email
+    elif len(to_email) == 1:
+        to_header = to_email[0]
+    else:
+        to_header = "undisclosed-recipients:;"
+    to_line = f"To: {to_header}\r\n".encode("ascii")
+    message = to_line + _flatten_message(subject, body, is_html)
+    return server.sendmail(SENDER_EMAIL, to_email, message)
+
+
+def _quit_smtp(server: smtplib.SMTP):
+    """Politely end an SMTP session, dropping it if the server has gone away."""
+    try:
+        server.quit()
+    except Exception:
+        server.close()
+
+
+def _error_result(error: Exception) -> dict:
+    """
+    Convert a sending error into the result dict returned by send_email.
+
+    Errors that will fail every other email too (bad login, or the server
+    permanently refusing our sender address, e.g. over the daily quota) are
+    marked "fatal" so bulk sends stop at once.
+    """
+    if isinstance(error, smtplib.SMTPAuthenticationError):
+        return {
+            "success": False,
+            "error": f"Authentication failed: {error}",
+            "fatal": True,
+        }
+    if isinstance(error, smtplib.SMTPSenderRefused) and error.smtp_code >= 500:
+        return {"success": False, "error": f"SMTP error: {error}", "fatal": True}
+    if isinstance(error, smtplib.SMTPException):
+        return {"success": False, "error": f"SMTP error: {error}"}
+    return {"success": False, "error": str(error)}
+
+
 def send_email(
     to_email: str, to_name: str, subject: str, body: str, is_html: bool = False
 ) -> dict:
     """
     Send an email using Gmail SMTP.
 
+    Opens a connection just for this email; use SMTPPool to send several.
+
     Args:
         to_email: Recipient email address
         to_name: Recipient name
@@ -218,42 +607,369 @@ def send_email(
     Returns:
         dict with success status and message
     """
-    if not SENDER_EMAIL or not GMAIL_APP_PASSWORD:
-        return {
-            "success": False,
-            "error": "GMAIL_SENDER_EMAIL or GMAIL_APP_PASSWORD not set in environment",
-        }
-
     try:
-        # Create message
-        message = MIMEMultipart("alternative")
-        message["Subject"] = subject
-        message["From"] = SENDER_EMAIL
-        message["To"] = to_email
-
-        # Attach body
-        if is_html:
-            part = MIMEText(body, "html")
+        _require_smtp_env()
+        with _open_smtp_connection() as server:
+            _send_on_connection(server, to_email, subject, body, is_html)
+
+        return {"success": True, "message": f"Email sent to {to_email}"}
+
+    except Exception as e:
+        return _error_result(e)
+
+
+# Errors opening a connection that mean "try again later", e.g. Gmail
+# refusing or dropping new connections while it throttles the account
+_TRANSIENT_CONNECT_ERRORS = (
+    smtplib.SMTPConnectError,
+    smtplib.SMTPServerDisconnected,
+    ConnectionError,
+    TimeoutError,
+)
+
+
+def _backoff(attempt: int):
+    """
+    Sleep before retrying a failed send: about 1s, 2s, 4s... by attempt.
+
+    Each delay is scaled by a random 0.5-1.5, so workers that failed
+    together (e.g. when Gmail throttles) don't all retry at once.
+    """
+    time.sleep(2**attempt * random.uniform(0.5, 1.5))
+
+
+class SMTPPool:
+    """
+    Thread-safe pool of authenticated SMTP connections.
+
+    Raises ValueError if the Gmail credentials are not configured.
+
+    At most ``max_size`` connections are open at once (SMTP_CONCURRENCY by
+    default, capped at SMTP_MAX_CONCURRENCY). Each idle connection is
+    kept as ``(server, msgs_sent)`` and is recycled after
+    ``max_msgs_per_conn`` messages, which keeps us under Gmail's
+    per-connection limit without logging in again for every email. Sends on
+    all connections together are spaced out to at most ``rate_per_sec``.
+    """
+
+    def __init__(
+        self,
+        max_size: int = None,
+        max_msgs_per_conn: int = SMTP_MAX_MSGS_PER_CONNECTION,
+        rate_per_sec: float = SMTP_RATE_PER_SEC,
+    ):
+        _require_smtp_env()
+        max_size = SMTP_CONCURRENCY if max_size is None else max_size
+        self.max_size = max(1, min(max_size, SMTP_MAX_CONCURRENCY))
+        self.max_msgs_per_conn = max_msgs_per_conn
+        self.rate_per_sec = rate_per_sec
+        self._rate_lock = threading.Lock()
+        self._next_send = 0.0
+        self._idle = queue.Queue()
+        self._slots = threading.BoundedSemaphore(self.max_size)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def acquire(self) -> tuple:
+        """Take an idle connection, or open one if fewer than max_size exist."""
+        self._slots.acquire()
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        try:
+            return (_open_smtp_connection(), 0)
+        except Exception:
+            self._slots.release()
+            raise
+
+    def release(self, conn: tuple, ok: bool = True):
+        """Return a connection; broken or used-up connections are closed."""
+        server, msgs_sent = conn
+        if ok and msgs_sent < self.max_msgs_per_conn:
+            self._idle.put(conn)
         else:
-            part = MIMEText(body, "plain")
-        message.attach(part)
+            _quit_smtp(server)
+        self._slots.release()
 
-        # Create secure connection and send
-        context = ssl.create_default_context()
+    def _wait_for_send_slot(self):
+        """Sleep until the rate limit allows another message."""
+        if not self.rate_per_sec:
+            return
+        with self._rate_lock:
+            now = time.monotonic()
+            slot = max(now, self._next_send)
+            self._next_send = slot + 1 / self.rate_per_sec
+        if slot > now:
+            time.sleep(slot - now)
+
+    def send(
+        self, to_email: str, to_name: str, subject: str, body: str, is_html=False
+    ) -> dict:
+        """Send one email on a pooled connection; same result as send_email."""
+        return self.send_many([to_email], subject, body, is_html)[to_email]
+
+    def send_many(
+        self, to_emails: list, subject: str, body: str, is_html=False
+    ) -> dict:
+        """
+        Send one message to several recipients in a single SMTP transaction.
+
+        Returns a send_email-style result for each address in to_emails.
+        Refused or dropped connections, temporary server errors and
+        recipients refused with a temporary code (SMTP_TRANSIENT_CODES) are
+        retried after a _backoff, up to SMTP_SEND_ATTEMPTS tries in all.
+        """
+        results = {}
+        pending = list(to_emails)
+        for attempt in range(SMTP_SEND_ATTEMPTS):
+            last_attempt = attempt == SMTP_SEND_ATTEMPTS - 1
+            try:
+                conn = self.acquire()
+            except _TRANSIENT_CONNECT_ERRORS as e:
+                if last_attempt:
+                    return {**results, **dict.fromkeys(pending, _error_result(e))}
+                _backoff(attempt)
+                continue
+            except Exception as e:
+                return {**results, **dict.fromkeys(pending, _error_result(e))}
+
+            server, msgs_sent = conn
+            self._wait_for_send_slot()
+            try:
+                refused = _send_on_connection(server, pending, subject, body, is_html)
+            except smtplib.SMTPServerDisconnected as e:
+                self.release(conn, ok=False)
+                if last_attempt:
+                    return {**results, **dict.fromkeys(pending, _error_result(e))}
+                _backoff(attempt)
+                continue
+            except smtplib.SMTPRecipientsRefused as e:
+                # Every recipient was rejected; handled below like a partial
+                # refusal, but nothing was delivered
+                refused = e.recipients
+            except smtplib.SMTPResponseException as e:
+                self.release(conn, ok=False)
+                if last_attempt or e.smtp_code not in SMTP_TRANSIENT_CODES:
+                    return {**results, **dict.fromkeys(pending, _error_result(e))}
+                _backoff(attempt)
+                continue
+            except Exception as e:
+                self.release(conn, ok=False)
+                return {**results, **dict.fromkeys(pending, _error_result(e))}
+
+            # A 421 refusal means the server closed (or is closing) the
+            # connection, so it must not go back to the idle pool
+            codes = {code for code, _ in refused.values()}
+            healthy = server.sock is not None and 421 not in codes
+            self.release((server, msgs_sent + len(pending)), ok=healthy)
+
+            retry = []
+            for email in pending:
+                if email not in refused:
+                    results[email] = {
+                        "success": True,
+                        "message": f"Email sent to {email}",
+                    }
+                elif refused[email][0] in SMTP_TRANSIENT_CODES and not last_attempt:
+                    retry.append(email)
+                else:
+                    results[email] = _error_result(
+                        smtplib.SMTPRecipientsRefused({email: refused[email]})
+                    )
+            if not retry:
+                return results
+            pending = retry
+            _backoff(attempt)
+
+    def close(self):
+        """Close all idle connections."""
+        while True:
+            try:
+                server, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            _quit_smtp(server)
 
-        with smtplib.SMTP(SMTP_SERVER, SMTP_PORT) as server:
-            server.starttls(context=context)
-            server.login(SENDER_EMAIL, GMAIL_APP_PASSWORD)
-            server.sendmail(SENDER_EMAIL, to_email, message.as_string())
 
-        return {"success": True, "message": f"Email sent to {to_email}"}
+# Bulk sends give up once at least ABORT_MIN_ATTEMPTS SMTP transactions were
+# tried and 1 in ABORT_FAILURE_FRACTION of them failed; the rest would fail
+# too. A message sent to several recipients at once counts as one attempt.
+# Set ABORT_ON_FAILURES to False (--no-abort) to try every recipient anyway;
+# a rejected login or sender address still stops the send (see _error_result).
+ABORT_ON_FAILURES = True
+ABORT_MIN_ATTEMPTS = 30
+ABORT_FAILURE_FRACTION = 3
+
+
+def _should_abort(stats: dict, attempted: int, failed: int, result: dict) -> bool:
+    """
+    Check whether a bulk send should stop after this many SMTP failures.
+
+    result is the latest failed send; a fatal one (see _error_result) stops
+    the send straight away, even with --no-abort. If stopping, explains why
+    and sets stats["aborted"].
+    """
+    if result.get("fatal"):
+        print(
+            f"\n🛑 ABORTING: {result['error']}"
+            " (every remaining email would fail the same way)"
+        )
+        stats["aborted"] = True
+        return True
+
+    if not (
+        ABORT_ON_FAILURES
+        and attempted >= ABORT_MIN_ATTEMPTS
+        and failed * ABORT_FAILURE_FRACTION >= attempted
+    ):
+        return False
+
+    print(
+        f"\n🛑 ABORTING: {failed} of {attempted} sends failed,"
+        " the SMTP server is not accepting mail (use --no-abort to keep going)"
+    )
+    stats["aborted"] = True
+    return True
+
+
+def _peek(iterable):
+    """
+    Check whether an iterable (e.g. a cursor) yields anything.
+
+    Returns an iterator over all of its items, or None if it is empty.
+    """
+    iterator = iter(iterable)
+    for first in iterator:
+        return itertools.chain((first,), iterator)
+    return None
 
-    except smtplib.SMTPAuthenticationError as e:
-        return {"success": False, "error": f"Authentication failed: {e}"}
-    except smtplib.SMTPException as e:
-        return {"success": False, "error": f"SMTP error: {e}"}
-    except Exception as e:
-        return {"success": False, "error": str(e)}
+
+def _send_window(pool: "SMTPPool") -> int:
+    """How many sends to queue ahead: enough to keep every connection busy."""
+    return MAX_RECIPIENTS_PER_MESSAGE * pool.max_size
+
+
+def _send_concurrently(messages, subject: str, stats: dict):
+    """
+    Send (to_email, to_name, body) messages in parallel over an SMTPPool.
+
+    messages may be a generator; it is read only a window of sends ahead of
+    the results (see _send_window), so e.g. users streamed from a cursor are
+    never all held in memory. No connection is opened if it is empty.
+    Yields (message, result) pairs with send_email-style results, in the
+    order given. Stops early, setting stats["aborted"], once too many sends
+    have failed (see _should_abort): queued sends are cancelled, and only
+    those already in progress are still yielded. Sends still queued are
+    also cancelled if iteration stops early.
+    """
+    stats["aborted"] = False
+    messages = _peek(messages)
+    if messages is None:
+        return
+
+    with SMTPPool() as pool, ThreadPoolExecutor(max_workers=pool.max_size) as ex:
+        window = _send_window(pool)
+        queued = deque()
+
+        def fill():
+            for message in itertools.islice(messages, window - len(queued)):
+                to_email, to_name, body = message
+                future = ex.submit(pool.send, to_email, to_name, subject, body)
+                queued.append((message, future))
+
+        attempted = failed = 0
+        try:
+            fill()
+            while queued:
+                message, future = queued.popleft()
+                if future.cancelled():
+                    continue
+                result = future.result()
+                yield message, result
+                if stats["aborted"]:
+                    continue
+
+                attempted += 1
+                if not result["success"]:
+                    failed += 1
+                    if _should_abort(stats, attempted, failed, result):
+                        # Sends a connection already picked up can't be
+                        # cancelled; they are still yielded so they get counted
+                        for _, pending in queued:
+                            pending.cancel()
+                        continue
+                fill()
+        finally:
+            for _, future in queued:
+                future.cancel()
+
+
+# Gmail accepts up to 100 recipients per message; stay well below that
+MAX_RECIPIENTS_PER_MESSAGE = 50
+
+# Placeholders that send_bulk_emails fills in a custom message
+_PLACEHOLDER_RE = re.compile(r"\{(name|username|email)\}")
+
+
+def _split_placeholders(template: str) -> list:
+    """
+    Parse a message template once into alternating literal text and
+    placeholder names, e.g. ["Hi ", "name", ", welcome!"].
+    """
+    return _PLACEHOLDER_RE.split(template)
+
+
+def _fill_placeholders(parts: list, values: dict) -> str:
+    """Render a template split by _split_placeholders in a single pass."""
+    return "".join(values[part] if i % 2 else part for i, part in enumerate(parts))
+
+
+class _ProgressWriter:
+    """
+    Buffer per-recipient progress lines and write them to stdout together.
+
+    Lines are written once ``max_lines`` have piled up or ``max_delay``
+    seconds have passed since the last write, so a terminal still shows
+    steady progress without one write per email.
+    """
+
+    def __init__(self, max_lines: int = 50, max_delay: float = 1.0):
+        self.max_lines = max_lines
+        self.max_delay = max_delay
+        self._lines = []
+        self._last_write = time.monotonic()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.flush()
+
+    def add(self, line: str):
+        self._lines.append(line)
+        if (
+            len(self._lines) >= self.max_lines
+            or time.monotonic() - self._last_write >= self.max_delay
+        ):
+            self.flush()
+
+    def flush(self):
+        if self._lines:
+            sys.stdout.write("\n".join(self._lines) + "\n")
+            sys.stdout.flush()
+            self._lines.clear()
+        self._last_write = time.monotonic()
+
+
+def _domain_key(email: str) -> tuple:
+    """Sort key grouping addresses by domain, e.g. ("example.com", "a@example.com")."""
+    email = (email or "").lower()
+    return (email.rpartition("@")[2], email)
 
 
 def send_bulk_emails(
@@ -262,59 +978,167 @@ def send_bulk_emails(
     message_template: str,
     include_credentials: bool = False,
     credentials_map: dict = None,
+    concurrency: int = None,
 ) -> dict:
     """
     Send emails to multiple users.
 
     Args:
-        users: List of user documents
+        users: Iterable of user documents (a list or a pymongo cursor)
         subject: Email subject
         message_template: Email message (use {name} for personalization)
         include_credentials: Whether to include login credentials
         credentials_map: Dict mapping username to plain password (for welcome emails)
+        concurrency: SMTP connections to send on in parallel (default
+            SMTP_CONCURRENCY, at most SMTP_MAX_CONCURRENCY)
 
     Returns:
-        Statistics about the email sending process
+        Statistics about the email sending process. "aborted" is True if
+        sending stopped early because too many emails failed; "total" then
+        counts only the users whose emails were attempted.
+
+    Raises ValueError before sending anything if the Gmail credentials are
+    not configured.
     """
-    stats = {"total": len(users), "sent": 0, "failed": 0, "errors": []}
+    _require_smtp_env()
+    stats = {"total": 0, "sent": 0, "failed": 0, "errors": [], "aborted": False}
+
+    users = _peek(users)
+    if users is None:
+        return stats
 
     print("\n" + "=" * 60)
     print("📧 SENDING EMAILS")
     print("=" * 60 + "\n")
 
-    for user in users:
-        email = user.get("email")
-        name = user.get("name", "User")
-        username = user.get("username", "")
+    template_parts = _split_placeholders(message_template)
 
-        if not email:
-            print(f"⚠️  Skipping {name} - no email address")
-            stats["failed"] += 1
-            stats["errors"].append({"user": name, "error": "No email address"})
-            continue
+    def render_users():
+        for user in users:
+            email = user.get("email")
+            name = user.get("name", "User")
+            username = user.get("username", "")
 
-        # Generate email body
-        if include_credentials and credentials_map and username in credentials_map:
-            body = get_welcome_email_body(name, username, credentials_map[username])
-        else:
-            # Personalize the message
-            personalized_message = message_template.replace("{name}", name)
-            personalized_message = personalized_message.replace("{username}", username)
-            personalized_message = personalized_message.replace("{email}", email)
-            body = get_custom_email_body(name, personalized_message)
+            if not email:
+                yield name, email, None
+                continue
 
-        # Send email
-        result = send_email(email, name, subject, body)
+            # Generate email body
+            if include_credentials and credentials_map and username in credentials_map:
+                body = get_welcome_email_body(name, username, credentials_map[username])
+            else:
+                # Personalize the message
+                personalized_message = _fill_placeholders(
+                    template_parts,
+                    {"name": name, "username": username, "email": email},
+                )
+                body = get_custom_email_body(name, personalized_message)
+
+            yield name, email, body
+
+    rendered_users = render_users()
+
+    def submit_window(pool, ex) -> list:
+        """
+        Render the next window of users and queue their sends.
+
+        Returns (name, email, future) jobs in user order; the future is None
+        for users without an address, and the list is empty once all users
+        are done.
+        """
+        rendered = list(itertools.islice(rendered_users, _send_window(pool)))
+
+        # Recipients in this window who get exactly the same message share one
+        # SMTP transaction; bodies with credentials or other personal details
+        # are sent one by one. Sends are queued grouped by recipient domain,
+        # so each multi-recipient message goes to as few mail servers as
+        # possible.
+        recipients_by_body = {}
+        for index in sorted(
+            range(len(rendered)), key=lambda i: _domain_key(rendered[i][1])
+        ):
+            body = rendered[index][2]
+            if body is not None:
+                recipients_by_body.setdefault(body, []).append(index)
+
+        futures = {}
+        for body, indexes in recipients_by_body.items():
+            for start in range(0, len(indexes), MAX_RECIPIENTS_PER_MESSAGE):
+                chunk = indexes[start : start + MAX_RECIPIENTS_PER_MESSAGE]
+                to_emails = [rendered[i][1] for i in chunk]
+                future = ex.submit(pool.send_many, to_emails, subject, body)
+                futures.update(dict.fromkeys(chunk, future))
+
+        return [
+            (name, email, futures.get(index))
+            for index, (name, email, _) in enumerate(rendered)
+        ]
 
-        if result["success"]:
-            print(f"✅ EMAIL SENT: {name} <{email}>")
-            stats["sent"] += 1
-        else:
-            print(f"❌ FAILED: {name} <{email}> - {result['error']}")
-            stats["failed"] += 1
-            stats["errors"].append(
-                {"user": name, "email": email, "error": result["error"]}
-            )
+    # Users are rendered and sent a window at a time, with the next window
+    # queued while this one's results are reported, so a cursor is never
+    # read into memory all at once. Results are reported in the original
+    # order from this thread.
+    with SMTPPool(concurrency) as pool, ThreadPoolExecutor(
+        max_workers=pool.max_size
+    ) as ex, _ProgressWriter() as progress:
+        windows = deque([submit_window(pool, ex)])
+
+        # The abort rule counts SMTP transactions, not recipients: one failed
+        # 50-recipient message is one failure, not 50
+        attempted = smtp_failed = 0
+        counted = set()
+
+        def report(name, email, future) -> dict:
+            """Add one user's outcome to stats; returns the send result."""
+            nonlocal attempted, smtp_failed
+            stats["total"] += 1
+            if future is None:
+                progress.add(f"⚠️  Skipping {name} - no email address")
+                stats["failed"] += 1
+                stats["errors"].append({"user": name, "error": "No email address"})
+                return None
+
+            transaction = future.result()
+            result = transaction[email]
+            if future not in counted:
+                counted.add(future)
+                attempted += 1
+                if not any(r["success"] for r in transaction.values()):
+                    smtp_failed += 1
+
+            if result["success"]:
+                progress.add(f"✅ EMAIL SENT: {name} <{email}>")
+                stats["sent"] += 1
+            else:
+                progress.add(f"❌ FAILED: {name} <{email}> - {result['error']}")
+                stats["failed"] += 1
+                stats["errors"].append(
+                    {"user": name, "email": email, "error": result["error"]}
+                )
+            return result
+
+        # Once the send aborts, nothing new is queued, but every send a
+        # connection already picked up (in this window or the next) is still
+        # reported, so sent/failed/errors cover each attempted address
+        while windows and windows[0]:
+            if not stats["aborted"]:
+                windows.append(submit_window(pool, ex))
+            current = windows.popleft()
+            for name, email, future in current:
+                if stats["aborted"] and (future is None or future.cancelled()):
+                    continue
+                result = report(name, email, future)
+                if result is None or result["success"] or stats["aborted"]:
+                    continue
+
+                # Keep the abort notice after the lines it refers to
+                progress.flush()
+                if _should_abort(stats, attempted, smtp_failed, result):
+                    for jobs in (current, *windows):
+                        for _, _, pending in jobs:
+                            if pending is not None:
+                                pending.cancel()
+            counted.clear()
 
     return stats
 
@@ -323,8 +1147,9 @@ def send_to_new_user(db, username: str, plain_password: str, subject: str = None
     """
     Send welcome email to a specific new user with their credentials.
     """
+    ensure_user_indexes(db)
     collection = db["users"]
-    user = collection.find_one({"username": username}, {"password": 0})
+    user = collection.find_one({"username": username}, _USER_PROJECTION)
 
     if not user:
         print(f"❌ User '{username}' not found in database")
@@ -355,31 +1180,45 @@ def send_to_new_user(db, username: str, plain_password: str, subject: str = None
 # =============================================================================
 
 
+def _print_summary(
+    stats: dict,
+    title: str = "EMAIL SENDING SUMMARY",
+    total_label: str = "Total",
+    sent_label: str = "Sent",
+):
+    """Write a send summary, including any errors, to stdout in one write."""
+    lines = [
+        "",
+        "=" * 60,
+        f"📊 {title}",
+        "=" * 60,
+        f"{total_label}: {stats['total']}",
+        f"{sent_label}: {stats['sent']}",
+        f"Failed: {stats['failed']}",
+    ]
+    if stats.get("errors"):
+        lines.append("\nErrors:")
+        for err in stats["errors"]:
+            who = err.get("user", err.get("email"))
+            if "row" in err:
+                who = f"Row {err['row']} {who}"
+            lines.append(f"  - {who}: {err['error']}")
+    sys.stdout.write("\n".join(lines) + "\n")
+
+
 def send_to_all_users(subject: str, message: str):
     """Send an email to all users in the database."""
     try:
         client = get_mongo_client()
         db = client["chatbot_logs"]
 
-        users = get_users_from_db(db)
+        stats = send_bulk_emails(get_users_cursor(db), subject, message)
 
-        if not users:
+        if not stats["total"]:
             print("❌ No users found in database")
             return
 
-        stats = send_bulk_emails(users, subject, message)
-
-        print("\n" + "=" * 60)
-        print("📊 EMAIL SENDING SUMMARY")
-        print("=" * 60)
-        print(f"Total users: {stats['total']}")
-        print(f"Emails sent: {stats['sent']}")
-        print(f"Failed: {stats['failed']}")
-
-        if stats["errors"]:
-            print("\nErrors:")
-            for err in stats["errors"]:
-                print(f"  - {err['user']}: {err['error']}")
+        _print_summary(stats, total_label="Total users", sent_label="Emails sent")
 
     except Exception as e:
         print(f"❌ Error: {e}")
@@ -392,28 +1231,51 @@ def send_to_recent_users(subject: str, message: str, hours: int = 24):
         client = get_mongo_client()
         db = client["chatbot_logs"]
 
-        users = get_new_users_from_db(db, hours)
+        users = get_new_users_cursor(db, hours)
+        stats = send_bulk_emails(users, subject, message)
 
-        if not users:
+        if not stats["total"]:
             print(f"❌ No users found added in the last {hours} hours")
             return
 
-        stats = send_bulk_emails(users, subject, message)
-
-        print("\n" + "=" * 60)
-        print("📊 EMAIL SENDING SUMMARY")
-        print("=" * 60)
-        print(f"Total recent users: {stats['total']}")
-        print(f"Emails sent: {stats['sent']}")
-        print(f"Failed: {stats['failed']}")
+        _print_summary(
+            stats, total_label="Total recent users", sent_label="Emails sent"
+        )
 
     except Exception as e:
         print(f"❌ Error: {e}")
         raise
 
 
+def _custom_users(email_list: list, names: list = None, db=None) -> list:
+    """
+    Create user-like dicts for compatibility with send_bulk_emails.
+
+    With a db, addresses that belong to registered users get their real name
+    and username (one query for the whole list); otherwise both default to
+    the part of the address before the "@".
+    """
+    addrs = [(i, addr.strip()) for i, addr in enumerate(email_list)]
+    addrs = [(i, addr) for i, addr in addrs if addr]
+    known = {}
+    if db is not None:
+        known = get_users_by_emails(db, [addr for _, addr in addrs])
+
+    users = []
+    for i, addr in addrs:
+        local_part = addr.split("@", 1)[0]
+        user = known.get(addr, {})
+        if names and i < len(names):
+            name = names[i]
+        else:
+            name = user.get("name") or local_part
+        username = user.get("username") or local_part
+        users.append({"email": addr, "name": name, "username": username})
+    return users
+
+
 def send_to_custom_emails(
-    email_list: list, subject: str, message: str, names: list = None
+    email_list: list, subject: str, message: str, names: list = None, db=None
 ) -> dict:
     """
     Send emails to a custom list of email addresses.
@@ -423,6 +1285,7 @@ def send_to_custom_emails(
         subject: Email subject
         message: Email message (use {name} for personalization)
         names: Optional list of names corresponding to emails
+        db: Optional MongoDB database to look up registered users' names
 
     Returns:
         Statistics about the email sending process
@@ -431,31 +1294,13 @@ def send_to_custom_emails(
         print("❌ No email addresses provided")
         return {"total": 0, "sent": 0, "failed": 0, "errors": []}
 
-    # Create user-like dicts for compatibility with send_bulk_emails
-    users = []
-    for i, email in enumerate(email_list):
-        email = email.strip()
-        if email:
-            name = names[i] if names and i < len(names) else email.split("@")[0]
-            users.append(
-                {"email": email, "name": name, "username": email.split("@")[0]}
-            )
+    users = _custom_users(email_list, names, db)
 
     print(f"\n📧 Sending to {len(users)} custom email address(es)...")
 
     stats = send_bulk_emails(users, subject, message)
 
-    print("\n" + "=" * 60)
-    print("📊 EMAIL SENDING SUMMARY")
-    print("=" * 60)
-    print(f"Total emails: {stats['total']}")
-    print(f"Sent: {stats['sent']}")
-    print(f"Failed: {stats['failed']}")
-
-    if stats["errors"]:
-        print("\nErrors:")
-        for err in stats["errors"]:
-            print(f"  - {err.get('email', err.get('user'))}: {err['error']}")
+    _print_summary(stats, total_label="Total emails")
 
     return stats
 
@@ -524,17 +1369,55 @@ def send_welcome_email_to_custom(
     return result
 
 
+# Form responses export with each participant's details and credentials
+USERS_CSV_PATH = os.path.join(
+    os.path.dirname(__file__),
+    "ERG Study Information form (Responses) - Form Responses 1.csv",
+)
+
+
+def _iter_csv_users(csv_path: str):
+    """
+    Yield (row_number, name, email, username, password) for each data row of
+    the responses CSV, with surrounding whitespace stripped.
+
+    Columns are located once by their stripped header names, so stray spaces
+    in the header (the export has "Password ") don't matter. Row numbers are
+    1-indexed and, as with csv.DictReader, blank lines are not counted.
+    """
+    with open(csv_path, "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = [column.strip() for column in next(reader, [])]
+        indexes = [
+            header.index(column) if column in header else None
+            for column in ("Name", "Email ID", "Username", "Password")
+        ]
+
+        row_number = 0
+        for row in reader:
+            if not row:
+                continue
+            row_number += 1
+            yield (row_number,) + tuple(
+                row[i].strip() if i is not None and i < len(row) else ""
+                for i in indexes
+            )
+
+
+# ((mtime_ns, size), credentials) of the last parse of the credentials CSV
+_credentials_cache = None
+
+
 def load_credentials_from_csv() -> dict:
     """
     Load username -> password mapping from the CSV file.
     Returns a dict mapping usernames to plain text passwords.
-    """
-    import csv
 
-    csv_path = os.path.join(
-        os.path.dirname(__file__),
-        "ERG Study Information form (Responses) - Form Responses 1.csv",
-    )
+    The mapping is parsed once and reused until the file changes on disk, so
+    treat the returned dict as read-only.
+    """
+    global _credentials_cache
+    csv_path = USERS_CSV_PATH
 
     credentials = {}
 
@@ -542,15 +1425,17 @@ def load_credentials_from_csv() -> dict:
         print(f"⚠️  CSV file not found: {csv_path}")
         return credentials
 
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            username = row.get("Username", "").strip()
-            password = row.get("Password ", "").strip()  # Note: space in column name
-            if username and password:
-                credentials[username] = password
+    stat = os.stat(csv_path)
+    version = (stat.st_mtime_ns, stat.st_size)
+    if _credentials_cache is not None and _credentials_cache[0] == version:
+        return _credentials_cache[1]
+
+    for _, _, _, username, password in _iter_csv_users(csv_path):
+        if username and password:
+            credentials[username] = password
 
     print(f"📄 Loaded {len(credentials)} credentials from CSV")
+    _credentials_cache = (version, credentials)
     return credentials
 
 
@@ -559,12 +1444,7 @@ def load_users_from_csv() -> list:
     Load full user information from CSV file.
     Returns a list of user dicts with name, email, username, password.
     """
-    import csv
-
-    csv_path = os.path.join(
-        os.path.dirname(__file__),
-        "ERG Study Information form (Responses) - Form Responses 1.csv",
-    )
+    csv_path = USERS_CSV_PATH
 
     users = []
 
@@ -572,23 +1452,16 @@ def load_users_from_csv() -> list:
         print(f"⚠️  CSV file not found: {csv_path}")
         return users
 
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            username = row.get("Username", "").strip()
-            password = row.get("Password ", "").strip()  # Note: space in column name
-            name = row.get("Name", "").strip()
-            email = row.get("Email ID", "").strip()
-
-            if username and password and email:
-                users.append(
-                    {
-                        "name": name or username,
-                        "email": email,
-                        "username": username,
-                        "password": password,
-                    }
-                )
+    for _, name, email, username, password in _iter_csv_users(csv_path):
+        if username and password and email:
+            users.append(
+                {
+                    "name": name or username,
+                    "email": email,
+                    "username": username,
+                    "password": password,
+                }
+            )
 
     print(f"📄 Loaded {len(users)} users from CSV")
     return users
@@ -606,12 +1479,7 @@ def load_users_from_csv_by_range(start_row: int, end_row: int) -> list:
     Returns:
         List of user dicts within the specified range.
     """
-    import csv
-
-    csv_path = os.path.join(
-        os.path.dirname(__file__),
-        "ERG Study Information form (Responses) - Form Responses 1.csv",
-    )
+    csv_path = USERS_CSV_PATH
 
     users = []
 
@@ -619,31 +1487,24 @@ def load_users_from_csv_by_range(start_row: int, end_row: int) -> list:
         print(f"⚠️  CSV file not found: {csv_path}")
         return users
 
-    with open(csv_path, "r", encoding="utf-8") as f:
-        reader = csv.DictReader(f)
-        for idx, row in enumerate(reader, start=1):  # 1-indexed
-            if idx < start_row:
-                continue
-            if idx > end_row:
-                break
+    for idx, name, email, username, password in _iter_csv_users(csv_path):
+        if idx < start_row:
+            continue
+        if idx > end_row:
+            break
 
-            username = row.get("Username", "").strip()
-            password = row.get("Password ", "").strip()  # Note: space in column name
-            name = row.get("Name", "").strip()
-            email = row.get("Email ID", "").strip()
-
-            if username and password and email:
-                users.append(
-                    {
-                        "row": idx,
-                        "name": name or username,
-                        "email": email,
-                        "username": username,
-                        "password": password,
-                    }
-                )
-            else:
-                print(f"⚠️  Row {idx}: Missing data (username/password/email)")
+        if username and password and email:
+            users.append(
+                {
+                    "row": idx,
+                    "name": name or username,
+                    "email": email,
+                    "username": username,
+                    "password": password,
+                }
+            )
+        else:
+            print(f"⚠️  Row {idx}: Missing data (username/password/email)")
 
     print(f"📄 Loaded {len(users)} users from CSV (rows {start_row}-{end_row})")
     return users
@@ -673,16 +1534,21 @@ def send_welcome_emails_to_csv_range(start_row: int, end_row: int) -> dict:
     print(f"📧 SENDING WELCOME EMAILS TO CSV ROWS {start_row}-{end_row}")
     print("=" * 60 + "\n")
 
-    for user in users:
+    messages = [
+        (
+            user["email"],
+            user["name"],
+            get_welcome_email_body(user["name"], user["username"], user["password"]),
+        )
+        for user in users
+    ]
+
+    for user, (_, result) in zip(users, _send_concurrently(messages, subject, stats)):
         email = user["email"]
         name = user["name"]
         username = user["username"]
-        password = user["password"]
         row = user["row"]
 
-        body = get_welcome_email_body(name, username, password)
-        result = send_email(email, name, subject, body)
-
         if result["success"]:
             print(f"✅ Row {row}: {name} <{email}> ({username})")
             stats["sent"] += 1
@@ -705,10 +1571,10 @@ def get_new_csv_users_not_in_db(db) -> list:
     if not csv_users:
         return []
 
-    # Get all usernames from database
+    # Get all usernames from database; the unique username index covers this
     collection = db["users"]
     db_usernames = set()
-    for user in collection.find({}, {"username": 1}):
+    for user in collection.find({}, {"_id": 0, "username": 1}):
         if user.get("username"):
             db_usernames.add(user["username"])
 
@@ -739,14 +1605,21 @@ def send_welcome_emails_to_new_csv_users(db) -> dict:
     print("📧 SENDING WELCOME EMAILS TO NEW CSV USERS")
     print("=" * 60 + "\n")
 
-    for user in new_users:
+    messages = [
+        (
+            user["email"],
+            user["name"],
+            get_welcome_email_body(user["name"], user["username"], user["password"]),
+        )
+        for user in new_users
+    ]
+
+    for user, (_, result) in zip(
+        new_users, _send_concurrently(messages, subject, stats)
+    ):
         email = user["email"]
         name = user["name"]
         username = user["username"]
-        password = user["password"]
-
-        body = get_welcome_email_body(name, username, password)
-        result = send_email(email, name, subject, body)
 
         if result["success"]:
             print(f"✅ EMAIL SENT: {name} <{email}> ({username})")
@@ -761,10 +1634,13 @@ def send_welcome_emails_to_new_csv_users(db) -> dict:
     return stats
 
 
-def send_welcome_emails_to_all(db, users: list) -> dict:
+def send_welcome_emails_to_all(db, users) -> dict:
     """
     Send welcome emails with credentials to all users.
     Credentials are loaded from the CSV file.
+
+    users may be a list or a cursor from get_users_cursor; a cursor is read
+    a window at a time while the first emails are already being sent.
     """
     credentials = load_credentials_from_csv()
 
@@ -772,34 +1648,44 @@ def send_welcome_emails_to_all(db, users: list) -> dict:
         print("❌ No credentials found in CSV. Cannot send welcome emails.")
         return {"total": 0, "sent": 0, "failed": 0, "errors": []}
 
-    stats = {"total": len(users), "sent": 0, "failed": 0, "errors": []}
+    stats = {"total": 0, "sent": 0, "failed": 0, "errors": []}
     subject = "Regarding CHEAL ERG Study Participation"
 
+    users = _peek(users)
+    if users is None:
+        return stats
+
     print("\n" + "=" * 60)
     print("📧 SENDING WELCOME EMAILS")
     print("=" * 60 + "\n")
 
-    for user in users:
-        email = user.get("email")
-        name = user.get("name", "User")
-        username = user.get("username", "")
-
-        if not email:
-            print(f"⚠️  Skipping {name} - no email address")
-            stats["failed"] += 1
-            stats["errors"].append({"user": name, "error": "No email address"})
-            continue
+    def prepare_messages():
+        for user in users:
+            email = user.get("email")
+            name = user.get("name", "User")
+            username = user.get("username", "")
+
+            if not email:
+                print(f"⚠️  Skipping {name} - no email address")
+                stats["total"] += 1
+                stats["failed"] += 1
+                stats["errors"].append({"user": name, "error": "No email address"})
+                continue
 
-        if username not in credentials:
-            print(f"⚠️  Skipping {name} ({username}) - no password in CSV")
-            stats["failed"] += 1
-            stats["errors"].append({"user": name, "error": "No password in CSV"})
-            continue
+            if username not in credentials:
+                print(f"⚠️  Skipping {name} ({username}) - no password in CSV")
+                stats["total"] += 1
+                stats["failed"] += 1
+                stats["errors"].append({"user": name, "error": "No password in CSV"})
+                continue
 
-        password = credentials[username]
-        body = get_welcome_email_body(name, username, password)
-        result = send_email(email, name, subject, body)
+            password = credentials[username]
+            yield email, name, get_welcome_email_body(name, username, password)
 
+    for (email, name, _), result in _send_concurrently(
+        prepare_messages(), subject, stats
+    ):
+        stats["total"] += 1
         if result["success"]:
             print(f"✅ EMAIL SENT: {name} <{email}>")
             stats["sent"] += 1
@@ -814,31 +1700,45 @@ def send_welcome_emails_to_all(db, users: list) -> dict:
 
 
 def send_reminder_emails_to_all(
-    db, users: list, cohort_number: int = 1, whatsapp_link: str = None
+    db, users, cohort_number: int = 1, whatsapp_link: str = None
 ) -> dict:
     """
     Send reminder emails to all users to complete their cohort.
+
+    users may be a list or a cursor from get_users_cursor; a cursor is read
+    a window at a time while the first emails are already being sent.
     """
-    stats = {"total": len(users), "sent": 0, "failed": 0, "errors": []}
+    stats = {"total": 0, "sent": 0, "failed": 0, "errors": []}
     subject = f"Reminder: Please Complete Cohort-{cohort_number} - ERG Study"
 
+    users = _peek(users)
+    if users is None:
+        return stats
+
     print("\n" + "=" * 60)
     print("📧 SENDING REMINDER EMAILS")
     print("=" * 60 + "\n")
 
-    for user in users:
-        email = user.get("email")
-        name = user.get("name", "User")
+    def prepare_messages():
+        for user in users:
+            email = user.get("email")
+            name = user.get("name", "User")
 
-        if not email:
-            print(f"⚠️  Skipping {name} - no email address")
-            stats["failed"] += 1
-            stats["errors"].append({"user": name, "error": "No email address"})
-            continue
+            if not email:
+                print(f"⚠️  Skipping {name} - no email address")
+                stats["total"] += 1
+                stats["failed"] += 1
+                stats["errors"].append({"user": name, "error": "No email address"})
+                continue
 
-        body = get_reminder_email_body(name, cohort_number, whatsapp_link)
-        result = send_email(email, name, subject, body)
+            yield email, name, get_reminder_email_body(
+                name, cohort_number, whatsapp_link
+            )
 
+    for (email, name, _), result in _send_concurrently(
+        prepare_messages(), subject, stats
+    ):
+        stats["total"] += 1
         if result["success"]:
             print(f"✅ EMAIL SENT: {name} <{email}>")
             stats["sent"] += 1
@@ -867,9 +1767,6 @@ def schedule_reminder_emails(
         whatsapp_link: WhatsApp group link for support
         filter_query: Optional MongoDB filter for users
     """
-    import time as time_module
-    from datetime import datetime, timedelta
-
     # Parse scheduled time
     try:
         scheduled_hour, scheduled_minute = map(int, scheduled_time.split(":"))
@@ -902,32 +1799,210 @@ def schedule_reminder_emails(
     print("\n⏳ Waiting... (Press Ctrl+C to cancel)")
 
     try:
-        time_module.sleep(wait_seconds)
+        # Sleep in short steps against the wall clock, so the send still goes
+        # out on time if the machine was suspended while waiting
+        while True:
+            remaining = (scheduled_datetime - datetime.now()).total_seconds()
+            if remaining <= 0:
+                break
+            time.sleep(min(SCHEDULE_POLL_SECONDS, remaining))
 
         print(f"\n🔔 Scheduled time reached! Sending emails...")
 
         # Connect to database and send
         client = get_mongo_client()
         db = client["chatbot_logs"]
-        users = get_users_from_db(db, filter_query)
+        users = get_users_cursor(db, filter_query)
 
-        if not users:
+        stats = send_reminder_emails_to_all(db, users, cohort_number, whatsapp_link)
+
+        if not stats["total"]:
             print("❌ No users found")
             return
 
-        stats = send_reminder_emails_to_all(db, users, cohort_number, whatsapp_link)
-
-        print("\n" + "=" * 60)
-        print("📊 SCHEDULED EMAIL SUMMARY")
-        print("=" * 60)
-        print(f"Total: {stats['total']}")
-        print(f"Sent: {stats['sent']}")
-        print(f"Failed: {stats['failed']}")
+        _print_summary(stats, "SCHEDULED EMAIL SUMMARY")
 
     except KeyboardInterrupt:
         print("\n\n❌ Scheduled send cancelled by user.")
 
 
+# =============================================================================
+# Config File Mode
+# =============================================================================
+
+
+class ConfigError(ValueError):
+    """A config is missing an option or has one of the wrong type."""
+
+
+_REQUIRED = object()
+
+
+def _option(config: dict, key: str, default=_REQUIRED, kind: type = None):
+    """
+    Read one option from a config, raising ConfigError if it's unusable.
+
+    int options also accept numeric strings, as the menu's prompts give them.
+    """
+    value = config.get(key)
+    if value is None:
+        if default is _REQUIRED:
+            raise ConfigError(f"missing {key!r}")
+        return default
+    if kind is int and isinstance(value, (int, str)) and not isinstance(value, bool):
+        try:
+            return int(value)
+        except ValueError:
+            pass
+    elif kind is None or isinstance(value, kind):
+        return value
+    raise ConfigError(f"{key!r} must be {kind.__name__}, got {value!r}")
+
+
+def _config_db():
+    return get_mongo_client()["chatbot_logs"]
+
+
+def _optional_config_db():
+    """The users database, or None when MongoDB isn't configured or is down."""
+    try:
+        return _config_db()
+    except (ValueError, ConnectionError) as e:
+        print(f"⚠️  Not looking up registered names: {e}")
+        return None
+
+
+def _config_welcome_all(config: dict) -> dict:
+    query = _option(config, "filter", None, dict)
+    db = _config_db()
+    return send_welcome_emails_to_all(db, get_users_cursor(db, query))
+
+
+def _config_welcome_recent(config: dict) -> dict:
+    hours = _option(config, "hours", 24, int)
+    db = _config_db()
+    return send_welcome_emails_to_all(db, get_new_users_cursor(db, hours))
+
+
+def _config_welcome_new_csv(config: dict) -> dict:
+    return send_welcome_emails_to_new_csv_users(_config_db())
+
+
+def _config_welcome_csv_range(config: dict) -> dict:
+    return send_welcome_emails_to_csv_range(
+        _option(config, "start_row", kind=int),
+        _option(config, "end_row", kind=int),
+    )
+
+
+def _config_reminder(config: dict) -> dict:
+    query = _option(config, "filter", None, dict)
+    cohort = _option(config, "cohort", 1, int)
+    whatsapp = _option(config, "whatsapp", None, str)
+    db = _config_db()
+    users = get_users_cursor(db, query)
+    return send_reminder_emails_to_all(db, users, cohort, whatsapp)
+
+
+def _config_schedule_reminder(config: dict):
+    schedule_reminder_emails(
+        _option(config, "time", "16:00", str),
+        _option(config, "cohort", 1, int),
+        _option(config, "whatsapp", None, str),
+        _option(config, "filter", None, dict),
+    )
+
+
+def _config_welcome_custom(config: dict):
+    send_welcome_email_to_custom(
+        _option(config, "to", kind=str),
+        _option(config, "name", kind=str),
+        _option(config, "username", kind=str),
+        _option(config, "password", kind=str),
+        _option(config, "subject", None, str),
+    )
+
+
+def _config_custom(config: dict) -> dict:
+    emails = _option(config, "to")
+    if isinstance(emails, str):
+        emails = [e.strip() for e in emails.split(",") if e.strip()]
+    elif not isinstance(emails, list):
+        raise ConfigError("'to' must be a list or a comma-separated string")
+    names = _option(config, "names", None, list)
+    subject = _option(config, "subject", "Message from ERG AI Learning Assistant", str)
+    message = _option(config, "message", kind=str)
+    users = _custom_users(emails, names, db=_optional_config_db())
+    return send_bulk_emails(users, subject, message)
+
+
+# "action" value in a config file -> handler taking the config, returning stats
+CONFIG_ACTIONS = {
+    "welcome_all": _config_welcome_all,
+    "welcome_recent": _config_welcome_recent,
+    "welcome_new_csv": _config_welcome_new_csv,
+    "welcome_csv_range": _config_welcome_csv_range,
+    "welcome_custom": _config_welcome_custom,
+    "reminder": _config_reminder,
+    "schedule_reminder": _config_schedule_reminder,
+    "custom": _config_custom,
+}
+
+# Summary titles for actions that don't use the default one
+CONFIG_SUMMARY_TITLES = {"reminder": "REMINDER EMAIL SUMMARY"}
+
+
+def run_config(config: dict):
+    """
+    Run the send described by a config dict and print its summary.
+
+    Shared by config files and the interactive menu, which builds the same
+    dict from its prompts.
+    """
+    action = config.get("action") if isinstance(config, dict) else None
+    handler = CONFIG_ACTIONS.get(action)
+    if handler is None:
+        print(
+            f"❌ Unknown action {action!r}. Choose one of: {', '.join(CONFIG_ACTIONS)}"
+        )
+        return
+
+    try:
+        stats = handler(config)
+    except ConfigError as e:
+        print(f"❌ Invalid options for {action!r}: {e}")
+        return
+    except (ValueError, ConnectionError) as e:
+        # Gmail or MongoDB settings missing, or the database unreachable
+        print(f"❌ Could not run {action!r}: {e}")
+        return
+
+    if stats is None:
+        return
+
+    _print_summary(stats, CONFIG_SUMMARY_TITLES.get(action, "EMAIL SENDING SUMMARY"))
+
+
+def run_config_file(config_path: str):
+    """
+    Run a send described by a JSON config file, without any prompts.
+
+    "action" picks one of CONFIG_ACTIONS; the other keys are its options.
+    Examples:
+        {"action": "reminder", "cohort": 2, "whatsapp": "https://..."}
+        {"action": "welcome_csv_range", "start_row": 31, "end_row": 45}
+        {"action": "custom", "to": ["a@example.com"], "message": "Hi {name}"}
+    """
+    try:
+        with open(config_path, "r", encoding="utf-8") as f:
+            config = json.load(f)
+    except (OSError, ValueError) as e:
+        print(f"❌ Could not read config file {config_path}: {e}")
+        return
+
+    run_config(config)
+
+
 def interactive_mode():
     """Run in interactive mode to compose and send emails."""
     print("\n" + "=" * 60)
@@ -976,52 +2051,34 @@ def interactive_mode():
 
     # Handle welcome emails to all users
     if choice == "1":
-        users = get_users_from_db(db)
-        if not users:
+        count = count_users(db)
+        if not count:
             print("❌ No users found in database")
             return
 
-        print(f"\n📧 Will send welcome emails to {len(users)} users")
+        print(f"\n📧 Will send welcome emails to {count} users")
         confirm = input("Proceed? (yes/no): ").strip().lower()
         if confirm != "yes":
             print("Aborted.")
             return
 
-        stats = send_welcome_emails_to_all(db, users)
-
-        print("\n" + "=" * 60)
-        print("📊 EMAIL SENDING SUMMARY")
-        print("=" * 60)
-        print(f"Total: {stats['total']}")
-        print(f"Sent: {stats['sent']}")
-        print(f"Failed: {stats['failed']}")
-        if stats["errors"]:
-            print("\nErrors:")
-            for err in stats["errors"]:
-                print(f"  - {err['user']}: {err['error']}")
+        run_config({"action": "welcome_all"})
         return
 
     # Handle welcome emails to recent users
     if choice == "2":
-        users = get_new_users_from_db(db, 24)
-        if not users:
+        count = count_new_users(db, 24)
+        if not count:
             print("❌ No users found added in the last 24 hours")
             return
 
-        print(f"\n📧 Will send welcome emails to {len(users)} recent users")
+        print(f"\n📧 Will send welcome emails to {count} recent users")
         confirm = input("Proceed? (yes/no): ").strip().lower()
         if confirm != "yes":
             print("Aborted.")
             return
 
-        stats = send_welcome_emails_to_all(db, users)
-
-        print("\n" + "=" * 60)
-        print("📊 EMAIL SENDING SUMMARY")
-        print("=" * 60)
-        print(f"Total: {stats['total']}")
-        print(f"Sent: {stats['sent']}")
-        print(f"Failed: {stats['failed']}")
+        run_config({"action": "welcome_recent", "hours": 24})
         return
 
     # Handle welcome email to specific user
@@ -1029,7 +2086,8 @@ def interactive_mode():
         username = input("Enter username: ").strip()
         credentials = load_credentials_from_csv()
 
-        user = db["users"].find_one({"username": username}, {"password": 0})
+        ensure_user_indexes(db)
+        user = db["users"].find_one({"username": username}, _USER_PROJECTION)
         if not user:
             print(f"❌ User '{username}' not found")
             return
@@ -1049,7 +2107,15 @@ def interactive_mode():
             print("Aborted.")
             return
 
-        send_welcome_email_to_custom(email, name, username, password)
+        run_config(
+            {
+                "action": "welcome_custom",
+                "to": email,
+                "name": name,
+                "username": username,
+                "password": password,
+            }
+        )
         return
 
     # Handle welcome email to custom address with manual credentials
@@ -1076,7 +2142,15 @@ def interactive_mode():
             print("Aborted.")
             return
 
-        send_welcome_email_to_custom(to_email, to_name, username, password)
+        run_config(
+            {
+                "action": "welcome_custom",
+                "to": to_email,
+                "name": to_name,
+                "username": username,
+                "password": password,
+            }
+        )
         return
 
     # Handle welcome emails to new CSV users (not in DB)
@@ -1100,18 +2174,7 @@ def interactive_mode():
             print("Aborted.")
             return
 
-        stats = send_welcome_emails_to_new_csv_users(db)
-
-        print("\n" + "=" * 60)
-        print("📊 EMAIL SENDING SUMMARY")
-        print("=" * 60)
-        print(f"Total: {stats['total']}")
-        print(f"Sent: {stats['sent']}")
-        print(f"Failed: {stats['failed']}")
-        if stats["errors"]:
-            print("\nErrors:")
-            for err in stats["errors"]:
-                print(f"  - {err['user']}: {err['error']}")
+        run_config({"action": "welcome_new_csv"})
         return
 
     # Handle welcome emails to CSV row range
@@ -1154,24 +2217,15 @@ def interactive_mode():
             print("Aborted.")
             return
 
-        stats = send_welcome_emails_to_csv_range(start_row, end_row)
-
-        print("\n" + "=" * 60)
-        print("📊 EMAIL SENDING SUMMARY")
-        print("=" * 60)
-        print(f"Total: {stats['total']}")
-        print(f"Sent: {stats['sent']}")
-        print(f"Failed: {stats['failed']}")
-        if stats["errors"]:
-            print("\nErrors:")
-            for err in stats["errors"]:
-                print(f"  - Row {err['row']} {err['user']}: {err['error']}")
+        run_config(
+            {"action": "welcome_csv_range", "start_row": start_row, "end_row": end_row}
+        )
         return
 
     # Handle reminder emails to all users
     if choice == "7":
-        users = get_users_from_db(db)
-        if not users:
+        count = count_users(db)
+        if not count:
             print("❌ No users found in database")
             return
 
@@ -1181,7 +2235,7 @@ def interactive_mode():
         whatsapp = input("WhatsApp group link (or press Enter to skip): ").strip()
         whatsapp_link = whatsapp if whatsapp else None
 
-        print(f"\n📧 Will send reminder emails to {len(users)} users")
+        print(f"\n📧 Will send reminder emails to {count} users")
         print(f"   Cohort: {cohort_number}")
         if whatsapp_link:
             print(f"   WhatsApp: {whatsapp_link}")
@@ -1191,14 +2245,9 @@ def interactive_mode():
             print("Aborted.")
             return
 
-        stats = send_reminder_emails_to_all(db, users, cohort_number, whatsapp_link)
-
-        print("\n" + "=" * 60)
-        print("📊 REMINDER EMAIL SUMMARY")
-        print("=" * 60)
-        print(f"Total: {stats['total']}")
-        print(f"Sent: {stats['sent']}")
-        print(f"Failed: {stats['failed']}")
+        run_config(
+            {"action": "reminder", "cohort": cohort_number, "whatsapp": whatsapp_link}
+        )
         return
 
     # Handle scheduled reminder emails
@@ -1228,7 +2277,14 @@ def interactive_mode():
             print("Aborted.")
             return
 
-        schedule_reminder_emails(scheduled_time, cohort_number, whatsapp_link)
+        run_config(
+            {
+                "action": "schedule_reminder",
+                "time": scheduled_time,
+                "cohort": cohort_number,
+                "whatsapp": whatsapp_link,
+            }
+        )
         return
 
     # Handle custom email (options 4 and 5)
@@ -1291,33 +2347,107 @@ def interactive_mode():
             return
 
         print(f"\n📧 Will send to {len(emails)} email(s): {', '.join(emails)}")
-        users = [
-            {"name": e.split("@")[0], "email": e, "username": e.split("@")[0]}
-            for e in emails
-        ]
+        config = {"to": emails}
     elif choice == "5":
-        users = [{"name": "Test User", "email": SENDER_EMAIL, "username": "test"}]
+        config = {"to": [SENDER_EMAIL], "names": ["Test User"]}
     else:
         print("Invalid choice")
         return
 
-    if not users:
-        print("❌ No users found")
-        return
+    run_config({"action": "custom", "subject": subject, "message": message, **config})
 
-    stats = send_bulk_emails(users, subject, message)
 
-    print("\n" + "=" * 60)
-    print("📊 EMAIL SENDING SUMMARY")
-    print("=" * 60)
-    print(f"Total: {stats['total']}")
-    print(f"Sent: {stats['sent']}")
-    print(f"Failed: {stats['failed']}")
+USAGE_EXAMPLES = """\
+examples:
+  python send_user_emails.py --interactive  # Interactive mode
+  python send_user_emails.py --test         # Send test email to yourself
+  python send_user_emails.py --config send.json  # Run a send from a JSON file
+
+  # Custom emails:
+  python send_user_emails.py --to email@example.com --subject 'Subject' --message 'Message'
+
+  # Reminder emails (send now):
+  python send_user_emails.py --reminder --cohort 1 --whatsapp 'https://chat.whatsapp.com/xxx'
+
+  # Schedule reminder emails:
+  python send_user_emails.py --schedule --time 16:00 --cohort 1 --whatsapp 'https://chat.whatsapp.com/xxx'
+
+  Add --no-abort to keep sending even when a third of the emails fail.
+
+Or import and use programmatically:
+  from send_user_emails import send_reminder_emails_to_all, schedule_reminder_emails
+"""
+
+
+def build_arg_parser() -> argparse.ArgumentParser:
+    """Build the command-line parser; one mode flag picks what to send."""
+    parser = argparse.ArgumentParser(
+        description="Send emails to ERG AI Tool users using Gmail SMTP.",
+        epilog=USAGE_EXAMPLES,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+    )
+
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument(
+        "-i",
+        "--interactive",
+        action="store_true",
+        help="compose and send interactively",
+    )
+    mode.add_argument(
+        "--test", action="store_true", help="send a test email to yourself"
+    )
+    mode.add_argument(
+        "--config", metavar="FILE", help="run the send described in a JSON file"
+    )
+    mode.add_argument(
+        "--to",
+        metavar="EMAILS",
+        help="send a custom email to comma-separated addresses",
+    )
+    mode.add_argument(
+        "--reminder", action="store_true", help="send reminder emails to all users now"
+    )
+    mode.add_argument(
+        "--schedule", action="store_true", help="send reminder emails at --time"
+    )
+
+    parser.add_argument(
+        "--subject",
+        default="Message from ERG AI Learning Assistant",
+        help="subject for --to",
+    )
+    parser.add_argument("--message", help="message for --to; prompted for when omitted")
+    parser.add_argument(
+        "--time", default="16:00", help="HH:MM (24-hour) for --schedule"
+    )
+    parser.add_argument(
+        "--cohort", type=int, default=1, help="cohort to remind about (default: 1)"
+    )
+    parser.add_argument("--whatsapp", metavar="LINK", help="WhatsApp group link")
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=SMTP_CONCURRENCY,
+        help=f"parallel SMTP connections (default: {SMTP_CONCURRENCY},"
+        f" max: {SMTP_MAX_CONCURRENCY})",
+    )
+    parser.add_argument(
+        "--no-abort",
+        action="store_true",
+        help="keep sending even when a third of the emails fail",
+    )
+    return parser
 
 
 def main():
     """Main entry point."""
-    import sys
+    global ABORT_ON_FAILURES, SMTP_CONCURRENCY
+
+    parser = build_arg_parser()
+    args = parser.parse_args()
+    if not 1 <= args.concurrency <= SMTP_MAX_CONCURRENCY:
+        parser.error(f"--concurrency must be between 1 and {SMTP_MAX_CONCURRENCY}")
 
     print("\n" + "=" * 60)
     print("📧 ERG AI Tool - Email Sender Script")
@@ -1341,9 +2471,18 @@ def main():
     print(f"✅ Sender Email: {SENDER_EMAIL}")
     print(f"✅ App Password: {'*' * 12} (configured)")
 
-    if "--interactive" in sys.argv or "-i" in sys.argv:
+    SMTP_CONCURRENCY = args.concurrency
+
+    if args.no_abort:
+        # Keep sending even when many emails fail
+        ABORT_ON_FAILURES = False
+
+    if args.interactive:
         interactive_mode()
-    elif "--test" in sys.argv:
+    elif args.config:
+        # Run a send described in a JSON file, without prompts
+        run_config_file(args.config)
+    elif args.test:
         # Send test email to yourself
         print("\n📧 Sending test email to yourself...")
         result = send_email(
@@ -1356,128 +2495,45 @@ def main():
             print(f"✅ TEST EMAIL SENT to {SENDER_EMAIL}")
         else:
             print(f"❌ TEST FAILED: {result['error']}")
-    elif "--to" in sys.argv:
+    elif args.to:
         # Send to custom email from command line
-        try:
-            to_index = sys.argv.index("--to")
-            to_email = sys.argv[to_index + 1]
-
-            # Get subject and message
-            subject = "Message from ERG AI Learning Assistant"
-            if "--subject" in sys.argv:
-                subj_index = sys.argv.index("--subject")
-                subject = sys.argv[subj_index + 1]
-
-            if "--message" in sys.argv:
-                msg_index = sys.argv.index("--message")
-                message = sys.argv[msg_index + 1]
-            else:
-                print("Enter your message (press Enter twice to finish):")
-                lines = []
-                while True:
-                    line = input()
-                    if line == "" and lines and lines[-1] == "":
-                        break
-                    lines.append(line)
-                message = "\n".join(lines[:-1]) if lines else ""
-
-            if not message:
-                print("❌ No message provided")
-                return
-
-            # Handle multiple emails (comma-separated)
-            emails = [e.strip() for e in to_email.split(",") if e.strip()]
-            send_to_custom_emails(emails, subject, message)
+        message = args.message
+        if message is None:
+            print("Enter your message (press Enter twice to finish):")
+            lines = []
+            while True:
+                line = input()
+                if line == "" and lines and lines[-1] == "":
+                    break
+                lines.append(line)
+            message = "\n".join(lines[:-1]) if lines else ""
+
+        if not message:
+            print("❌ No message provided")
+            return
 
-        except (IndexError, ValueError) as e:
-            print(f"❌ Error parsing arguments: {e}")
-            print(
-                "Usage: python send_user_emails.py --to email@example.com --subject 'Subject' --message 'Message'"
-            )
-    elif "--schedule" in sys.argv:
+        # Handle multiple emails (comma-separated)
+        emails = [e.strip() for e in args.to.split(",") if e.strip()]
+        send_to_custom_emails(emails, args.subject, message)
+    elif args.schedule:
         # Schedule reminder emails from command line
-        try:
-            # Get time (default 16:00)
-            scheduled_time = "16:00"
-            if "--time" in sys.argv:
-                time_index = sys.argv.index("--time")
-                scheduled_time = sys.argv[time_index + 1]
-
-            # Get cohort (default 1)
-            cohort_number = 1
-            if "--cohort" in sys.argv:
-                cohort_index = sys.argv.index("--cohort")
-                cohort_number = int(sys.argv[cohort_index + 1])
-
-            # Get WhatsApp link
-            whatsapp_link = None
-            if "--whatsapp" in sys.argv:
-                wa_index = sys.argv.index("--whatsapp")
-                whatsapp_link = sys.argv[wa_index + 1]
-
-            schedule_reminder_emails(scheduled_time, cohort_number, whatsapp_link)
-
-        except (IndexError, ValueError) as e:
-            print(f"❌ Error parsing arguments: {e}")
-            print(
-                "Usage: python send_user_emails.py --schedule --time 16:00 --cohort 1 --whatsapp 'link'"
-            )
-    elif "--reminder" in sys.argv:
+        schedule_reminder_emails(args.time, args.cohort, args.whatsapp)
+    elif args.reminder:
         # Send reminder emails immediately
         try:
             client = get_mongo_client()
             db = client["chatbot_logs"]
-            users = get_users_from_db(db)
-
-            # Get cohort (default 1)
-            cohort_number = 1
-            if "--cohort" in sys.argv:
-                cohort_index = sys.argv.index("--cohort")
-                cohort_number = int(sys.argv[cohort_index + 1])
-
-            # Get WhatsApp link
-            whatsapp_link = None
-            if "--whatsapp" in sys.argv:
-                wa_index = sys.argv.index("--whatsapp")
-                whatsapp_link = sys.argv[wa_index + 1]
+            users = get_users_cursor(db)
 
-            stats = send_reminder_emails_to_all(db, users, cohort_number, whatsapp_link)
+            stats = send_reminder_emails_to_all(db, users, args.cohort, args.whatsapp)
 
-            print("\n" + "=" * 60)
-            print("📊 REMINDER EMAIL SUMMARY")
-            print("=" * 60)
-            print(f"Total: {stats['total']}")
-            print(f"Sent: {stats['sent']}")
-            print(f"Failed: {stats['failed']}")
+            _print_summary(stats, "REMINDER EMAIL SUMMARY")
 
         except Exception as e:
             print(f"❌ Error: {e}")
     else:
-        print("\nUsage:")
-        print("  python send_user_emails.py --interactive  # Interactive mode")
-        print(
-            "  python send_user_emails.py --test         # Send test email to yourself"
-        )
         print()
-        print("  # Custom emails:")
-        print(
-            "  python send_user_emails.py --to email@example.com --subject 'Subject' --message 'Message'"
-        )
-        print()
-        print("  # Reminder emails (send now):")
-        print(
-            "  python send_user_emails.py --reminder --cohort 1 --whatsapp 'https://chat.whatsapp.com/xxx'"
-        )
-        print()
-        print("  # Schedule reminder emails:")
-        print(
-            "  python send_user_emails.py --schedule --time 16:00 --cohort 1 --whatsapp 'https://chat.whatsapp.com/xxx'"
-        )
-        print()
-        print("Or import and use programmatically:")
-        print(
-            "  from send_user_emails import send_reminder_emails_to_all, schedule_reminder_emails"
-        )
+        parser.print_help()
 
 
 if __name__ == "__main__":
@@ -0,0 +1,414 @@
+"""
+Unit tests for the SMTP pooling, retry, abort and pipelining code in
+send_user_emails.py. No network: connections are fakes scripted per test.
+
+Run from this directory with: python -m unittest test_send_user_emails
+"""
+
+import smtplib
+import threading
+import unittest
+from collections import deque
+from unittest import mock
+
+import send_user_emails as m
+
+SENDER = "sender@example.com"
+
+
+def _patch(test: unittest.TestCase, *args, **kwargs):
+    patcher = mock.patch.object(*args, **kwargs)
+    test.addCleanup(patcher.stop)
+    return patcher.start()
+
+
+def _patch_env(test: unittest.TestCase):
+    """Configure fake Gmail credentials and make retries instant."""
+    _patch(test, m, "SENDER_EMAIL", SENDER)
+    _patch(test, m, "GMAIL_APP_PASSWORD", "app-password")
+    return _patch(test, m, "_backoff")
+
+
+class FakeSMTP:
+    """
+    Stands in for an authenticated smtplib.SMTP connection.
+
+    Each sendmail() call takes the next scripted outcome: a refused-recipients
+    dict to return, or an exception to raise. SMTPServerDisconnected and a
+    421 refusal leave the connection closed, as smtplib does.
+    """
+
+    def __init__(self, outcomes):
+        self.outcomes = outcomes
+        self.sock = object()
+        self.calls = []
+        self.quit_called = False
+
+    def sendmail(self, from_addr, to_addrs, msg):
+        self.calls.append(list(to_addrs))
+        outcome = self.outcomes.popleft()
+        if isinstance(outcome, smtplib.SMTPServerDisconnected):
+            self.sock = None
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    def quit(self):
+        self.quit_called = True
+        self.sock = None
+
+    def close(self):
+        self.sock = None
+
+
+class SMTPPoolSendManyTest(unittest.TestCase):
+    def setUp(self):
+        self.backoff = _patch_env(self)
+        self.outcomes = deque()
+        self.connections = []
+        self.connect_errors = deque()
+
+        def open_connection():
+            if self.connect_errors:
+                raise self.connect_errors.popleft()
+            server = FakeSMTP(self.outcomes)
+            self.connections.append(server)
+            return server
+
+        _patch(self, m, "_open_smtp_connection", open_connection)
+        self.pool = m.SMTPPool(max_size=2, rate_per_sec=0)
+        self.addCleanup(self.pool.close)
+
+    def send(self, *to_emails):
+        return self.pool.send_many(list(to_emails), "Subject", "Body")
+
+    def test_success_reuses_connection(self):
+        self.outcomes.extend([{}, {}])
+
+        self.assertTrue(self.send("a@x.com", "b@x.com")["a@x.com"]["success"])
+        self.assertTrue(self.send("c@x.com")["c@x.com"]["success"])
+
+        self.assertEqual(len(self.connections), 1)
+        self.assertEqual(
+            self.connections[0].calls, [["a@x.com", "b@x.com"], ["c@x.com"]]
+        )
+        self.backoff.assert_not_called()
+
+    def test_partial_permanent_refusal_fails_only_that_recipient(self):
+        self.outcomes.append({"b@x.com": (550, b"no such user")})
+
+        results = self.send("a@x.com", "b@x.com")
+
+        self.assertTrue(results["a@x.com"]["success"])
+        self.assertFalse(results["b@x.com"]["success"])
+        self.assertIn("550", results["b@x.com"]["error"])
+        self.assertEqual(len(self.connections[0].calls), 1)
+
+    def test_partial_transient_refusal_retries_only_refused(self):
+        self.outcomes.extend([{"b@x.com": (452, b"too many recipients")}, {}])
+
+        results = self.send("a@x.com", "b@x.com")
+
+        self.assertTrue(results["a@x.com"]["success"])
+        self.assertTrue(results["b@x.com"]["success"])
+        self.assertEqual(
+            self.connections[0].calls, [["a@x.com", "b@x.com"], ["b@x.com"]]
+        )
+        self.backoff.assert_called_once_with(0)
+
+    def test_421_refusal_drops_connection(self):
+        self.outcomes.extend([{"b@x.com": (421, b"closing")}, {}])
+
+        results = self.send("a@x.com", "b@x.com")
+
+        self.assertTrue(results["b@x.com"]["success"])
+        self.assertEqual(len(self.connections), 2)
+        self.assertTrue(self.connections[0].quit_called)
+        self.assertEqual(self.connections[1].calls, [["b@x.com"]])
+
+    def test_all_refused_421_retries_then_fails(self):
+        refused = {"a@x.com": (421, b"try later"), "b@x.com": (421, b"try later")}
+        self.outcomes.extend(
+            smtplib.SMTPRecipientsRefused(refused) for _ in range(m.SMTP_SEND_ATTEMPTS)
+        )
+
+        results = self.send("a@x.com", "b@x.com")
+
+        self.assertFalse(results["a@x.com"]["success"])
+        self.assertFalse(results["b@x.com"]["success"])
+        self.assertEqual(len(self.connections), m.SMTP_SEND_ATTEMPTS)
+        self.assertTrue(all(c.quit_called for c in self.connections))
+        self.assertEqual(self.backoff.call_count, m.SMTP_SEND_ATTEMPTS - 1)
+
+    def test_disconnect_retries_on_new_connection(self):
+        self.outcomes.extend([smtplib.SMTPServerDisconnected("gone"), {}])
+
+        results = self.send("a@x.com")
+
+        self.assertTrue(results["a@x.com"]["success"])
+        self.assertEqual(len(self.connections), 2)
+        self.backoff.assert_called_once_with(0)
+
+    def test_refused_connection_backs_off_and_retries(self):
+        self.connect_errors.extend(
+            [ConnectionRefusedError("refused"), smtplib.SMTPConnectError(421, b"busy")]
+        )
+        self.outcomes.append({})
+
+        results = self.send("a@x.com")
+
+        self.assertTrue(results["a@x.com"]["success"])
+        self.assertEqual([c.args for c in self.backoff.call_args_list], [(0,), (1,)])
+
+    def test_transient_response_error_backs_off(self):
+        self.outcomes.extend([smtplib.SMTPDataError(451, b"local error"), {}])
+
+        self.assertTrue(self.send("a@x.com")["a@x.com"]["success"])
+        self.backoff.assert_called_once_with(0)
+
+    def test_permanent_response_error_is_not_retried(self):
+        self.outcomes.append(smtplib.SMTPDataError(554, b"rejected"))
+
+        results = self.send("a@x.com")
+
+        self.assertFalse(results["a@x.com"]["success"])
+        self.assertEqual(len(self.connections), 1)
+        self.backoff.assert_not_called()
+
+    def test_login_failure_is_fatal(self):
+        self.connect_errors.append(smtplib.SMTPAuthenticationError(535, b"bad login"))
+
+        result = self.send("a@x.com")["a@x.com"]
+
+        self.assertFalse(result["success"])
+        self.assertTrue(result["fatal"])
+        self.backoff.assert_not_called()
+
+
+class ShouldAbortTest(unittest.TestCase):
+    def setUp(self):
+        self.stats = {"aborted": False}
+        self.failure = {"success": False, "error": "refused"}
+        _patch(self, m, "ABORT_ON_FAILURES", True)
+        _patch(self, m, "print", create=True)
+
+    def test_needs_minimum_attempts(self):
+        attempts = m.ABORT_MIN_ATTEMPTS - 1
+        self.assertFalse(m._should_abort(self.stats, attempts, attempts, self.failure))
+        self.assertFalse(self.stats["aborted"])
+
+    def test_aborts_at_failure_fraction(self):
+        attempts = m.ABORT_MIN_ATTEMPTS
+        failed = attempts // m.ABORT_FAILURE_FRACTION
+        self.assertFalse(
+            m._should_abort(self.stats, attempts, failed - 1, self.failure)
+        )
+        self.assertTrue(m._should_abort(self.stats, attempts, failed, self.failure))
+        self.assertTrue(self.stats["aborted"])
+
+    def test_no_abort_keeps_going(self):
+        m.ABORT_ON_FAILURES = False
+        attempts = m.ABORT_MIN_ATTEMPTS
+        self.assertFalse(m._should_abort(self.stats, attempts, attempts, self.failure))
+
+    def test_fatal_aborts_at_once_even_with_no_abort(self):
+        m.ABORT_ON_FAILURES = False
+        fatal = {**self.failure, "fatal": True}
+        self.assertTrue(m._should_abort(self.stats, 1, 1, fatal))
+        self.assertTrue(self.stats["aborted"])
+
+
+class FakePool:
+    """
+    Stands in for SMTPPool in send_bulk_emails, recording each transaction.
+
+    fail(email) decides whether a recipient is refused.
+    """
+
+    instances = []
+
+    def __init__(self, max_size=None, fail=lambda email: False):
+        self.max_size = 2
+        self.fail = fail
+        self.transactions = []
+        self.lock = threading.Lock()
+        FakePool.instances.append(self)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        pass
+
+    def send_many(self, to_emails, subject, body, is_html=False):
+        with self.lock:
+            self.transactions.append(list(to_emails))
+        return {
+            email: (
+                {"success": False, "error": "refused"}
+                if self.fail(email)
+                else {"success": True, "message": "sent"}
+            )
+            for email in to_emails
+        }
+
+
+class SendBulkEmailsTest(unittest.TestCase):
+    def setUp(self):
+        _patch_env(self)
+        _patch(self, m, "print", create=True)
+        _patch(self, m.sys, "stdout")
+        FakePool.instances = []
+
+    def run_bulk(self, users, message="Hi {name}", fail=lambda email: False):
+        pool = mock.Mock(side_effect=lambda size: FakePool(size, fail))
+        with mock.patch.object(m, "SMTPPool", pool):
+            return m.send_bulk_emails(iter(users), "Subject", message)
+
+    def users(self, count, name=None):
+        return [{"email": f"u{i}@x.com", "name": name or f"U{i}"} for i in range(count)]
+
+    def recipients_sent(self):
+        return sum(len(t) for p in FakePool.instances for t in p.transactions)
+
+    def test_empty_input_opens_no_pool(self):
+        stats = self.run_bulk([])
+        self.assertEqual(stats["total"], 0)
+        self.assertEqual(FakePool.instances, [])
+
+    def test_counts_every_user(self):
+        users = self.users(250) + [{"name": "No Address"}]
+
+        stats = self.run_bulk(users)
+
+        self.assertEqual(stats["total"], 251)
+        self.assertEqual(stats["sent"], 250)
+        self.assertEqual(stats["failed"], 1)
+        self.assertFalse(stats["aborted"])
+
+    def test_same_body_shares_transactions(self):
+        # The greeting includes the name, so only namesakes share a body
+        stats = self.run_bulk(self.users(120, name="Student"), message="Hello")
+
+        transactions = FakePool.instances[0].transactions
+        self.assertEqual(stats["sent"], 120)
+        self.assertTrue(all(len(t) > 1 for t in transactions))
+        self.assertTrue(
+            max(len(t) for t in transactions) <= m.MAX_RECIPIENTS_PER_MESSAGE
+        )
+
+    def test_abort_accounts_for_every_attempted_recipient(self):
+        stats = self.run_bulk(self.users(5000), fail=lambda email: True)
+
+        attempted = self.recipients_sent()
+        self.assertTrue(stats["aborted"])
+        self.assertLess(attempted, 5000)
+        self.assertEqual(stats["total"], attempted)
+        self.assertEqual(stats["sent"] + stats["failed"], attempted)
+        self.assertEqual(len(stats["errors"]), attempted)
+
+    def test_abort_reports_whole_multi_recipient_transactions(self):
+        stats = self.run_bulk(
+            self.users(5000, name="Student"), message="Hello", fail=lambda email: True
+        )
+
+        attempted = self.recipients_sent()
+        self.assertTrue(stats["aborted"])
+        self.assertEqual(attempted % m.MAX_RECIPIENTS_PER_MESSAGE, 0)
+        self.assertEqual(stats["total"], attempted)
+        self.assertEqual(stats["failed"], attempted)
+
+
+class ScriptedSMTP(m.PipelinedSMTP):
+    """
+    PipelinedSMTP with its socket replaced by a log of writes and a queue of
+    scripted replies, so command/reply ordering can be checked.
+    """
+
+    def __init__(self, replies, features):
+        super().__init__()
+        self.ehlo_resp = b"ok"
+        self.does_esmtp = True
+        self.esmtp_features = features
+        self.replies = deque(replies)
+        self.events = []
+
+    def send(self, s):
+        self.events.append(("send", s.encode("ascii") if isinstance(s, str) else s))
+
+    def getreply(self):
+        self.events.append(("reply", None))
+        return self.replies.popleft()
+
+    def commands(self):
+        return [
+            data.split(b" ")[0].strip().lower()
+            for kind, data in self.events
+            if kind == "send"
+        ]
+
+
+MESSAGE = b"Subject: Hi\r\n\r\n.leading dot\r\n"
+
+
+class PipelinedSMTPTest(unittest.TestCase):
+    def test_pipelines_envelope_when_supported(self):
+        server = ScriptedSMTP(
+            [(250, b"ok"), (250, b"ok"), (550, b"no user"), (354, b"go"), (250, b"ok")],
+            {"pipelining": "", "size": "35882577"},
+        )
+
+        refused = server.sendmail(SENDER, ["a@x.com", "b@x.com"], MESSAGE)
+
+        self.assertEqual(refused, {"b@x.com": (550, b"no user")})
+        kinds = [kind for kind, _ in server.events]
+        # MAIL, both RCPTs and DATA are written before the first reply is read
+        self.assertEqual(kinds[:5], ["send"] * 4 + ["reply"])
+        self.assertTrue(
+            server.events[0][1].startswith(b"mail FROM:<sender@example.com> size=")
+        )
+        self.assertIn(b"\r\n..leading dot\r\n.\r\n", server.events[-2][1])
+
+    def test_all_recipients_refused_ends_data_and_raises(self):
+        server = ScriptedSMTP(
+            [
+                (250, b"ok"),
+                (550, b"no"),
+                (550, b"no"),
+                (354, b"go"),
+                (250, b"ok"),
+                (250, b"reset"),
+            ],
+            {"pipelining": ""},
+        )
+
+        with self.assertRaises(smtplib.SMTPRecipientsRefused):
+            server.sendmail(SENDER, ["a@x.com", "b@x.com"], MESSAGE)
+
+        self.assertIn(("send", b".\r\n"), server.events)
+        self.assertEqual(server.commands()[-1], b"rset")
+
+    def test_sender_refused_raises(self):
+        server = ScriptedSMTP(
+            [(550, b"quota"), (503, b"no"), (503, b"no"), (250, b"reset")],
+            {"pipelining": ""},
+        )
+
+        with self.assertRaises(smtplib.SMTPSenderRefused):
+            server.sendmail(SENDER, ["a@x.com"], MESSAGE)
+
+    def test_falls_back_to_one_round_trip_per_command(self):
+        server = ScriptedSMTP(
+            [(250, b"ok"), (250, b"ok"), (354, b"go"), (250, b"ok")], {}
+        )
+
+        refused = server.sendmail(SENDER, ["a@x.com"], MESSAGE)
+
+        self.assertEqual(refused, {})
+        kinds = [kind for kind, _ in server.events]
+        self.assertEqual(kinds, ["send", "reply"] * 4)
+        self.assertEqual(server.commands()[:3], [b"mail", b"rcpt", b"data"])
+
+
+if __name__ == "__main__":
+    unittest.main()